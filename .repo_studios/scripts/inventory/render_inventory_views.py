@@ -1,31 +1,59 @@
 #!/usr/bin/env python3
-"""Generate secondary inventory views for Repo Studios."""
+"""Generate secondary inventory views for Repo Studios.
+
+JSON artifacts are encoded with `orjson` when it is installed (optional) and
+with the standard library otherwise.
+
+Every artifact written by one run shares a single `generated_at` stamp; set
+`SOURCE_DATE_EPOCH_ISO` to an ISO-8601 timestamp for reproducible output.
+Files whose content is unchanged apart from that stamp are not rewritten, so
+their mtimes stay stable between no-op runs.
+"""
 from __future__ import annotations
 
 import argparse
 import json
-from collections import Counter, defaultdict
+import os
+import re
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-import yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from yaml_cache import cached_yaml_load_many, dump_yaml
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_ROOT = ROOT / "inventory_schema"
 VIEWS_DIR = SCHEMA_ROOT / "views"
 REPORTS_ROOT = ROOT / "reports"
 IGNORED_FILES = {"enums.yaml", "inventory_entry_template.yaml"}
+_ROOT_PREFIX = str(ROOT) + os.sep
+
+# Matches the `generated_at` line in both the YAML and the indented JSON output.
+_STAMP_LINE = re.compile(rb'^(\s*(?:- )?"?generated_at"?: ).*$', re.MULTILINE)
+
+
+def _iter_yaml(root: Path) -> Iterable[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Rendered views live under `views/`; prune the subtree instead of checking parents per file.
+        if "views" in dirnames:
+            dirnames.remove("views")
+        for filename in filenames:
+            if filename.endswith(".yaml") and filename not in IGNORED_FILES:
+                yield Path(dirpath, filename)
 
 
 def load_inventory(schema_root: Path) -> List[Dict[str, Any]]:
+    # Sorted so the rendered views list records in a stable order.
+    paths = sorted(_iter_yaml(schema_root))
     entries: List[Dict[str, Any]] = []
-    for path in sorted(schema_root.glob("**/*.yaml")):
-        if path.name in IGNORED_FILES:
-            continue
-        if VIEWS_DIR in path.parents:
-            continue
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or []
+    for data in cached_yaml_load_many(paths):
+        data = data or []
         if isinstance(data, list):
             for item in data:
                 if isinstance(item, dict):
@@ -37,129 +65,168 @@ def ensure_views_dir() -> None:
     VIEWS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def docs_view(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    out = []
-    for record in entries:
-        if record.get("asset_kind") != "document":
-            continue
-        out.append(
-            {
-                "id": record.get("id"),
-                "name": record.get("name"),
-                "path": record.get("path"),
-                "maturity": record.get("maturity"),
-                "status": record.get("status"),
-                "consumers": record.get("consumers", []),
-                "tags": record.get("tags", []),
-                "artifact_type": record.get("artifact_type"),
-            }
-        )
-    return out
-
-
-def scripts_view(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    out = []
-    for record in entries:
-        if record.get("asset_kind") != "script":
-            continue
-        out.append(
-            {
-                "id": record.get("id"),
-                "name": record.get("name"),
-                "path": record.get("path"),
-                "roles": record.get("roles", []),
-                "maturity": record.get("maturity"),
-                "status": record.get("status"),
-                "tags": record.get("tags", []),
-                "related_assets": record.get("related_assets", []),
-                "artifact_type": record.get("artifact_type"),
-            }
-        )
-    return out
-
-
-def tests_view(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    out = []
-    for record in entries:
-        if record.get("asset_kind") != "test":
-            continue
-        out.append(
-            {
-                "id": record.get("id"),
-                "name": record.get("name"),
-                "path": record.get("path"),
-                "status": record.get("status"),
-                "related_assets": record.get("related_assets", []),
-                "artifact_type": record.get("artifact_type"),
-            }
-        )
-    return out
-
-
-def summary_view(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-    counters: Dict[str, Counter] = defaultdict(Counter)
-    total = 0
-    status_by_kind: Dict[str, Counter] = defaultdict(Counter)
-    maturity_by_kind: Dict[str, Counter] = defaultdict(Counter)
+# Columns of each per-kind view, in output order. List-valued columns default to `[]`.
+DOC_COLUMNS = ("id", "name", "path", "maturity", "status", "consumers", "tags", "artifact_type")
+SCRIPT_COLUMNS = ("id", "name", "path", "roles", "maturity", "status", "tags", "related_assets", "artifact_type")
+TEST_COLUMNS = ("id", "name", "path", "status", "related_assets", "artifact_type")
+LIST_COLUMNS = frozenset({"consumers", "tags", "roles", "related_assets"})
+
+
+def _make_projector(name: str, columns: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compile a row builder that returns `columns` of a record as one dict display.
+
+    The generated body is a single literal dict of `get` calls, so there is no
+    per-column loop or zip at call time.
+    """
+    items = ", ".join(
+        f"{column!r}: get({column!r}, [])" if column in LIST_COLUMNS else f"{column!r}: get({column!r})"
+        for column in columns
+    )
+    source = f"def {name}(record):\n    get = record.get\n    return {{{items}}}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<render_inventory_views {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_doc_row = _make_projector("_doc_row", DOC_COLUMNS)
+_script_row = _make_projector("_script_row", SCRIPT_COLUMNS)
+_test_row = _make_projector("_test_row", TEST_COLUMNS)
+
+
+def _nest_pairs(pair_counts: Counter) -> Dict[str, Dict[str, int]]:
+    """Expand a Counter keyed by `(outer, inner)` tuples into nested dicts."""
+    nested: Dict[str, Dict[str, int]] = {}
+    for (outer, inner), count in pair_counts.items():
+        nested.setdefault(outer, {})[inner] = count
+    return nested
+
+
+def run_timestamp() -> str:
+    """Return the `generated_at` stamp for this run."""
+    return os.environ.get("SOURCE_DATE_EPOCH_ISO") or datetime.now(timezone.utc).isoformat()
+
+
+def build_all_views(
+    entries: Iterable[Dict[str, Any]],
+    generated_at: str | None = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    """Build every rendered artifact in a single pass over `entries`.
+
+    Returns `(docs, scripts, tests, summary, dashboard)`.
+    """
+    docs: List[Dict[str, Any]] = []
+    scripts: List[Dict[str, Any]] = []
+    tests: List[Dict[str, Any]] = []
+    # Scalar fields are gathered into parallel lists and tallied once at the end;
+    # Counter(iterable) counts in C instead of one `+= 1` dispatch per record.
+    kinds: List[Any] = []
+    maturities: List[Any] = []
+    statuses: List[Any] = []
+    artifact_type_list: List[Any] = []
     consumer_counts: Counter = Counter()
     tag_counts: Counter = Counter()
+    role_counts: Counter = Counter()
     for record in entries:
-        total += 1
-        counters["asset_kind"][record.get("asset_kind", "unknown")] += 1
-        counters["maturity"][record.get("maturity", "unknown")] += 1
-        counters["status"][record.get("status", "unknown")] += 1
-        asset_kind = record.get("asset_kind", "unknown")
-        status = record.get("status", "unknown")
-        maturity = record.get("maturity", "unknown")
-        status_by_kind[asset_kind][status] += 1
-        maturity_by_kind[asset_kind][maturity] += 1
-        for consumer in record.get("consumers", []):
-            consumer_counts[consumer] += 1
-        for tag in record.get("tags", []):
-            tag_counts[tag] += 1
-    generated_at = datetime.now(timezone.utc).isoformat()
-    return {
-        "generated_at": generated_at,
+        get = record.get
+        asset_kind = get("asset_kind", "unknown")
+        if asset_kind == "document":
+            docs.append(_doc_row(record))
+        elif asset_kind == "script":
+            scripts.append(_script_row(record))
+        elif asset_kind == "test":
+            tests.append(_test_row(record))
+        kinds.append(asset_kind)
+        maturities.append(get("maturity", "unknown"))
+        statuses.append(get("status", "unknown"))
+        artifact_type_list.append(get("artifact_type", "unknown"))
+        consumer_counts.update(get("consumers", ()))
+        tag_counts.update(get("tags", ()))
+        role_counts.update(get("roles", ()))
+    total = len(kinds)
+    kind_counts = Counter(kinds)
+    maturity_counts = Counter(maturities)
+    status_counts = Counter(statuses)
+    status_by_kind = Counter(zip(kinds, statuses))
+    maturity_by_kind = Counter(zip(kinds, maturities))
+    artifact_types = Counter(artifact_type_list)
+    maturity_nested = _nest_pairs(maturity_by_kind)
+    summary = {
+        "generated_at": generated_at or run_timestamp(),
         "total": total,
-        "by_asset_kind": dict(counters["asset_kind"]),
-        "by_maturity": dict(counters["maturity"]),
-        "by_status": dict(counters["status"]),
-        "status_by_asset_kind": {kind: dict(counter) for kind, counter in status_by_kind.items()},
-        "maturity_by_asset_kind": {kind: dict(counter) for kind, counter in maturity_by_kind.items()},
+        "by_asset_kind": dict(kind_counts),
+        "by_maturity": dict(maturity_counts),
+        "by_status": dict(status_counts),
+        "status_by_asset_kind": _nest_pairs(status_by_kind),
+        "maturity_by_asset_kind": maturity_nested,
         "consumers": dict(consumer_counts),
         "top_tags": [
             {"tag": tag, "count": count}
             for tag, count in tag_counts.most_common()
         ],
     }
-
-
-def summary_dashboard(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-    maturity_totals: Dict[str, Counter] = defaultdict(Counter)
-    role_counts: Counter = Counter()
-    artifact_types: Counter = Counter()
-    for record in entries:
-        maturity = record.get("maturity", "unknown")
-        asset_kind = record.get("asset_kind", "unknown")
-        maturity_totals[asset_kind][maturity] += 1
-        for role in record.get("roles", []):
-            role_counts[role] += 1
-        artifact_types[record.get("artifact_type", "unknown")] += 1
-
-    return {
-        "maturity_totals_by_asset_kind": {kind: dict(counter) for kind, counter in maturity_totals.items()},
+    # The dashboard's per-kind maturity totals are the same tally as the summary's.
+    dashboard = {
+        "maturity_totals_by_asset_kind": {kind: dict(counts) for kind, counts in maturity_nested.items()},
         "roles": dict(role_counts),
         "artifact_types": dict(artifact_types),
     }
+    return docs, scripts, tests, summary, dashboard
+
+
+def _kind_view(
+    entries: Iterable[Dict[str, Any]],
+    kind: str,
+    row: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    return [row(record) for record in entries if record.get("asset_kind") == kind]
+
+
+def docs_view(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _kind_view(entries, "document", _doc_row)
+
+
+def scripts_view(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _kind_view(entries, "script", _script_row)
+
+
+def tests_view(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _kind_view(entries, "test", _test_row)
+
+
+def summary_view(entries: Iterable[Dict[str, Any]], generated_at: str | None = None) -> Dict[str, Any]:
+    return build_all_views(entries, generated_at)[3]
+
+
+def summary_dashboard(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    return build_all_views(entries)[4]
 
 
-def write_yaml(path: Path, data: Any) -> None:
-    with path.open("w", encoding="utf-8") as fh:
-        yaml.safe_dump(data, fh, default_flow_style=False, sort_keys=False)
+def _write_if_changed(path: Path, new_bytes: bytes) -> bool:
+    """Write `new_bytes` to `path` unless only the `generated_at` stamp differs.
 
+    Returns True when the file was written.
+    """
+    try:
+        old_bytes = path.read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
+        if old_bytes == new_bytes or _STAMP_LINE.sub(rb"\1", old_bytes) == _STAMP_LINE.sub(rb"\1", new_bytes):
+            return False
+    path.write_bytes(new_bytes)
+    return True
+
+
+def write_yaml(path: Path, data: Any) -> bool:
+    return _write_if_changed(path, dump_yaml(data))
 
-def write_json(path: Path, data: Any) -> None:
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+def write_json(path: Path, data: Any) -> bool:
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    return _write_if_changed(path, payload)
 
 
 def ensure_report_topics(reports_root: Path) -> Dict[str, Path]:
@@ -175,18 +242,21 @@ def ensure_report_topics(reports_root: Path) -> Dict[str, Path]:
     return topics
 
 
-def write_stub(path: Path, destination: Path) -> None:
+def write_stub(path: Path, destination: Path, generated_at: str | None = None) -> None:
     """Write a compatibility stub pointing to the new report location."""
-    generated_at = datetime.now(timezone.utc).isoformat()
-    relative = destination.relative_to(ROOT)
+    if generated_at is None:
+        generated_at = run_timestamp()
+    # Destinations come from resolved paths, so a prefix strip matches `relative_to(ROOT)`;
+    # anything outside the studio root is redirected to by absolute path.
+    relative = str(destination).removeprefix(_ROOT_PREFIX)
     if path.suffix == ".json":
-        write_json(path, {"redirect": str(relative), "generated_at": generated_at})
+        write_json(path, {"redirect": relative, "generated_at": generated_at})
     else:
         write_yaml(
             path,
             [
                 {
-                    "redirect": str(relative),
+                    "redirect": relative,
                     "generated_at": generated_at,
                     "note": "View relocated under reports/<topic>/latest/.",
                 }
@@ -209,25 +279,27 @@ def main() -> int:
     views_dir.mkdir(parents=True, exist_ok=True)
     reports_root.mkdir(parents=True, exist_ok=True)
     topic_paths = ensure_report_topics(reports_root)
+    generated_at = run_timestamp()
+
+    docs, scripts, tests, summary_data, dashboard_data = build_all_views(entries, generated_at)
 
     docs_path = topic_paths["docs"] / "docs_overview.yaml"
-    write_yaml(docs_path, docs_view(entries))
-    write_stub(views_dir / "docs_overview.yaml", docs_path)
+    write_yaml(docs_path, docs)
+    write_stub(views_dir / "docs_overview.yaml", docs_path, generated_at)
 
     scripts_path = topic_paths["scripts"] / "scripts_overview.yaml"
-    write_yaml(scripts_path, scripts_view(entries))
-    write_stub(views_dir / "scripts_overview.yaml", scripts_path)
+    write_yaml(scripts_path, scripts)
+    write_stub(views_dir / "scripts_overview.yaml", scripts_path, generated_at)
 
     tests_path = topic_paths["tests"] / "tests_overview.yaml"
-    write_yaml(tests_path, tests_view(entries))
-    write_stub(views_dir / "tests_overview.yaml", tests_path)
+    write_yaml(tests_path, tests)
+    write_stub(views_dir / "tests_overview.yaml", tests_path, generated_at)
 
     summary_path = topic_paths["summary"] / "summary.json"
-    summary_data = summary_view(entries)
     write_json(summary_path, summary_data)
     dashboard_path = topic_paths["summary"] / "dashboard.json"
-    write_json(dashboard_path, summary_dashboard(entries))
-    write_stub(views_dir / "summary.json", summary_path)
+    write_json(dashboard_path, dashboard_data)
+    write_stub(views_dir / "summary.json", summary_path, generated_at)
 
     return 0
 
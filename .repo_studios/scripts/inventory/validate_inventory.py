@@ -4,6 +4,8 @@
 Loads inventory YAML entries under `.repo_studios/inventory_schema/` and enforces
 schema rules defined in `inventory_schema_spec.md` and `enums.yaml`.
 
+The `--json` report is encoded with `orjson` when it is installed (optional).
+
 Exit codes:
 - 0: validation passed with no errors (warnings allowed)
 - 1: validation failed (schema violations)
@@ -12,12 +14,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-import yaml
+from yaml_cache import cached_yaml_load, cached_yaml_load_many
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_ROOT = ROOT / "inventory_schema"
@@ -30,6 +39,15 @@ class ValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _rel_to_root(path_str: str) -> str:
+    # Schema roots passed via --schema-root may live outside the studio tree.
+    try:
+        return str(Path(path_str).relative_to(ROOT))
+    except ValueError:
+        return path_str
+
+
 @dataclass
 class ValidationIssue:
     level: str
@@ -40,32 +58,65 @@ class ValidationIssue:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "level": self.level,
-            "file": str(self.file.relative_to(ROOT)),
+            "file": _rel_to_root(str(self.file)),
             "message": self.message,
             "context": self.context,
         }
 
 
+IssueRow = Tuple[str, Path, str, str, Dict[str, Any]]
+
+
 @dataclass
 class ValidationReport:
-    issues: List[ValidationIssue] = field(default_factory=list)
+    """Collects findings as plain `(level, file, rel_file, message, context)` rows.
+
+    `ValidationIssue` objects are only built when `issues`/`errors`/`warnings`
+    are read, so noisy runs do not pay for a dataclass per finding. Those
+    properties return a fresh read-only tuple on each access; record findings
+    with `add()`.
+    """
+
+    rows: List[IssueRow] = field(default_factory=list)
 
     def add(self, level: str, file: Path, message: str, **context: Any) -> None:
-        self.issues.append(ValidationIssue(level=level, file=file, message=message, context=context))
+        self.rows.append((level, file, _rel_to_root(str(file)), message, context))
+
+    def _materialize(self, level: str | None = None) -> Tuple[ValidationIssue, ...]:
+        return tuple(
+            ValidationIssue(level=row_level, file=file, message=message, context=context)
+            for row_level, file, _, message, context in self.rows
+            if level is None or row_level == level
+        )
+
+    def count(self, level: str) -> int:
+        return sum(1 for row in self.rows if row[0] == level)
 
     @property
-    def errors(self) -> List[ValidationIssue]:
-        return [issue for issue in self.issues if issue.level == "error"]
+    def issues(self) -> Tuple[ValidationIssue, ...]:
+        return self._materialize()
 
     @property
-    def warnings(self) -> List[ValidationIssue]:
-        return [issue for issue in self.issues if issue.level == "warning"]
+    def errors(self) -> Tuple[ValidationIssue, ...]:
+        return self._materialize("error")
+
+    @property
+    def warnings(self) -> Tuple[ValidationIssue, ...]:
+        return self._materialize("warning")
 
     def to_json(self) -> str:
-        return json.dumps({"issues": [issue.to_dict() for issue in self.issues]}, indent=2)
+        payload = {
+            "issues": [
+                {"level": level, "file": rel, "message": message, "context": context}
+                for level, _, rel, message, context in self.rows
+            ]
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return json.dumps(payload, indent=2)
 
 
-REQUIRED_FIELDS = {
+REQUIRED_FIELDS = frozenset({
     "id",
     "name",
     "path",
@@ -76,57 +127,89 @@ REQUIRED_FIELDS = {
     "consumers",
     "status",
     "artifact_type",
-}
+})
 
-LIST_FIELDS = {
+LIST_FIELDS = frozenset({
     "roles",
     "consumers",
     "governance_flags",
     "related_assets",
     "tags",
-}
+})
+
+
+_EMPTY_ENUM: FrozenSet[str] = frozenset()
 
 
 @dataclass
 class EnumRegistry:
     enums: Dict[str, Sequence[str]]
+    _sets: Dict[str, FrozenSet[str]] = field(init=False, repr=False)
+    _record_check: Callable[..., None] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._sets = {name: frozenset(values or ()) for name, values in self.enums.items()}
 
     @classmethod
     def load(cls) -> "EnumRegistry":
-        with ENUMS_PATH.open("r", encoding="utf-8") as fh:
-            enums = yaml.safe_load(fh) or {}
+        enums = dict(cached_yaml_load(ENUMS_PATH) or {})
         enums.setdefault("status", ["active", "needs_review", "archived"])
         return cls(enums=enums)
 
-    def ensure(self, enum_name: str, values: Iterable[str], report: ValidationReport, file: Path, record_id: str) -> None:
-        allowed = set(self.enums.get(enum_name, []))
-        for value in values:
-            if value not in allowed:
-                report.add(
-                    "error",
-                    file,
-                    f"Value '{value}' is not allowed for enum '{enum_name}'",
-                    record_id=record_id,
-                    enum=enum_name,
-                )
+    def record_check(self) -> Callable[..., None]:
+        """Return the generated per-record checker, compiling it on first use."""
+        if self._record_check is None:
+            self._record_check = compile_record_check(self._sets)
+        return self._record_check
 
+    def allowed(self, enum_name: str) -> FrozenSet[str]:
+        return self._sets.get(enum_name, _EMPTY_ENUM)
 
-def load_yaml(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or []
+    def ensure(self, enum_name: str, values: Iterable[str], report: ValidationReport, file: Path, record_id: str) -> None:
+        self.check_many(((enum_name, values),), report, file, record_id)
+
+    def check_many(
+        self,
+        items: Iterable[Tuple[str, Iterable[Any]]],
+        report: ValidationReport,
+        file: Path,
+        record_id: str | None,
+    ) -> None:
+        """Check several `(enum_name, values)` pairs with one call per record."""
+        sets = self._sets
+        add = report.add
+        for enum_name, values in items:
+            allowed = sets.get(enum_name, _EMPTY_ENUM)
+            for value in values:
+                if value not in allowed:
+                    add(
+                        "error",
+                        file,
+                        f"Value '{value}' is not allowed for enum '{enum_name}'",
+                        record_id=record_id,
+                        enum=enum_name,
+                    )
 
 
-def iterate_inventory_files(root: Path) -> Iterable[Path]:
-    for path in sorted(root.rglob("*.yaml")):
-        if path.name in {ENUMS_PATH.name, TEMPLATE_PATH.name, CONFIG_PATH.name}:
-            continue
-        try:
-            relative_parts = path.relative_to(root).parts
-        except ValueError:
-            relative_parts = path.parts
-        if "views" in relative_parts:
-            continue
-        yield path
+def load_yaml(path: Path) -> Any:
+    return cached_yaml_load(path) or []
+
+
+def iterate_inventory_files(root: Path) -> List[Path]:
+    skip_names = {ENUMS_PATH.name, TEMPLATE_PATH.name, CONFIG_PATH.name}
+    results: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Rendered views live under `views/`; prune instead of filtering per file.
+                    if entry.name != "views":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".yaml") and entry.name not in skip_names:
+                    results.append(Path(entry.path))
+    results.sort()
+    return results
 
 
 @dataclass
@@ -139,8 +222,7 @@ class ValidatorConfig:
     def load(cls, path: Path) -> "ValidatorConfig":
         if not path.exists():
             return cls()
-        with path.open("r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = cached_yaml_load(path) or {}
         path_conf = data.get("path_existence", {})
         return cls(
             ignore_path_prefixes=tuple(path_conf.get("ignore_prefixes", [])),
@@ -156,49 +238,62 @@ class ValidatorConfig:
         return any(path_value.startswith(prefix) for prefix in self.ignore_path_prefixes)
 
 
-def _resolve_candidate_paths(path_value: str, schema_root: Path) -> List[Path]:
-    candidate = Path(path_value)
-    if candidate.is_absolute():
-        return [candidate]
-    candidates = [ROOT / candidate]
+@lru_cache(maxsize=None)
+def _candidate_roots(schema_root: Path) -> Tuple[str, ...]:
+    roots = [str(ROOT)]
     # allow relative paths during testing where schema root is temporary
-    candidates.append(schema_root.parent / candidate)
+    roots.append(str(schema_root.parent))
     # Some inventory entries reference workspace-relative paths such as `.repo_studios/...`
     # so ensure the repository root is considered when resolving existence.
     if schema_root.parent.parent.exists():
-        candidates.append(schema_root.parent.parent / candidate)
-    return candidates
+        roots.append(str(schema_root.parent.parent))
+    return tuple(roots)
+
+
+@lru_cache(maxsize=None)
+def _path_exists(path_str: str) -> bool:
+    return os.path.exists(path_str)
+
+
+def _resolve_candidate_paths(path_value: str, schema_root: Path) -> List[str]:
+    if os.path.isabs(path_value):
+        return [path_value]
+    return [os.path.join(root, path_value) for root in _candidate_roots(schema_root)]
 
 
 def _check_required_fields(record: Dict[str, Any], file: Path, report: ValidationReport) -> None:
     record_id = record.get("id") or "<unknown>"
-    missing = REQUIRED_FIELDS - set(record.keys())
+    missing = REQUIRED_FIELDS.difference(record.keys())
     if missing:
         report.add("error", file, f"Missing required fields: {sorted(missing)}", record_id=record_id)
 
 
 def _check_list_fields(record: Dict[str, Any], file: Path, report: ValidationReport) -> None:
     record_id = record.get("id")
-    for field in LIST_FIELDS:
-        if field in record and not isinstance(record[field], list):
+    present = LIST_FIELDS.intersection(record.keys())
+    for field in sorted(present):
+        if not isinstance(record[field], list):
             report.add("error", file, f"Field '{field}' must be a list", record_id=record_id)
 
 
-def _check_enums(record: Dict[str, Any], file: Path, registry: EnumRegistry, report: ValidationReport) -> None:
-    record_id = record.get("id")
-    enum_map = {
-        "asset_kind": [record.get("asset_kind")],
-        "maturity": [record.get("maturity")],
-        "status": [record.get("status")],
-    }
-    for enum_name, values in enum_map.items():
-        if values[0] is not None:
-            registry.ensure(enum_name, values, report, file, record_id)
+SCALAR_ENUM_FIELDS = ("asset_kind", "maturity", "status")
+LIST_ENUM_FIELDS = ("roles", "consumers")
+
+
+def _enum_items(record: Dict[str, Any]) -> List[Tuple[str, Iterable[Any]]]:
+    items: List[Tuple[str, Iterable[Any]]] = []
+    for enum_name in SCALAR_ENUM_FIELDS:
+        value = record.get(enum_name)
+        if value is not None:
+            items.append((enum_name, (value,)))
+    for enum_name in LIST_ENUM_FIELDS:
+        if enum_name in record:
+            items.append((enum_name, record[enum_name]))
+    return items
 
-    if "roles" in record:
-        registry.ensure("roles", record["roles"], report, file, record_id)
-    if "consumers" in record:
-        registry.ensure("consumers", record["consumers"], report, file, record_id)
+
+def _check_enums(record: Dict[str, Any], file: Path, registry: EnumRegistry, report: ValidationReport) -> None:
+    registry.check_many(_enum_items(record), report, file, record.get("id"))
 
 
 def _check_dependencies(record: Dict[str, Any], file: Path, report: ValidationReport) -> None:
@@ -248,7 +343,7 @@ def _check_paths(
         return
 
     for candidate in _resolve_candidate_paths(path_value, schema_root):
-        if candidate.exists():
+        if _path_exists(candidate):
             return
 
     report.add(
@@ -259,6 +354,56 @@ def _check_paths(
     )
 
 
+def compile_record_check(sets: Dict[str, FrozenSet[str]]) -> Callable[..., None]:
+    """Generate a record checker specialised to the schema and the given enum sets.
+
+    The list-field and enum checks, which run per field on every record, are
+    unrolled with their field names, messages and enum sets baked in as
+    constants. The remaining checks call the `_check_*` helpers directly, so
+    behaviour matches running `_check_*` in order.
+    """
+    lines = [
+        "def _record_check(record, file, report, config, schema_root):",
+        "    add = report.add",
+        "    get = record.get",
+        "    record_id = get('id')",
+        "    _check_required_fields(record, file, report)",
+    ]
+    for name in sorted(LIST_FIELDS):
+        lines += [
+            f"    if {name!r} in record and not isinstance(record[{name!r}], list):",
+            f"        add('error', file, {f'Field {name!r} must be a list'!r}, record_id=record_id)",
+        ]
+    namespace: Dict[str, Any] = {
+        "_check_required_fields": _check_required_fields,
+        "_check_dependencies": _check_dependencies,
+        "_check_paths": _check_paths,
+    }
+    for name in SCALAR_ENUM_FIELDS + LIST_ENUM_FIELDS:
+        namespace[f"_ENUM_{name}"] = sets.get(name, _EMPTY_ENUM)
+        message = f"f\"Value '{{value}}' is not allowed for enum {name!r}\""
+        if name in SCALAR_ENUM_FIELDS:
+            lines += [
+                f"    value = get({name!r})",
+                f"    if value is not None and value not in _ENUM_{name}:",
+                f"        add('error', file, {message}, record_id=record_id, enum={name!r})",
+            ]
+        else:
+            lines += [
+                f"    if {name!r} in record:",
+                f"        for value in record[{name!r}]:",
+                f"            if value not in _ENUM_{name}:",
+                f"                add('error', file, {message}, record_id=record_id, enum={name!r})",
+            ]
+    lines += [
+        "    _check_dependencies(record, file, report)",
+        "    _check_paths(record, file, report, config, schema_root)",
+    ]
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, "<validate_inventory record check>", "exec"), namespace)
+    return namespace["_record_check"]
+
+
 def validate_record(
     record: Dict[str, Any],
     file: Path,
@@ -267,46 +412,51 @@ def validate_record(
     config: ValidatorConfig,
     schema_root: Path,
 ) -> None:
-    _check_required_fields(record, file, report)
-    _check_list_fields(record, file, report)
-    _check_enums(record, file, registry, report)
-    _check_dependencies(record, file, report)
-    _check_paths(record, file, report, config, schema_root)
+    """Run every per-record check in a single pass.
+
+    Equivalent to calling the `_check_*` helpers in order (same messages, same
+    ordering); the work is done by the checker `compile_record_check` generated
+    for `registry`.
+    """
+    registry.record_check()(record, file, report, config, schema_root)
 
 
 def validate_file(
     path: Path,
     registry: EnumRegistry,
     report: ValidationReport,
-    seen_ids: Dict[str, Path],
+    seen_ids: Dict[str, str],
     config: ValidatorConfig,
     schema_root: Path,
+    data: Any = None,
 ) -> None:
-    data = load_yaml(path)
+    if data is None:
+        data = load_yaml(path)
+    add = report.add
     if not isinstance(data, list):
-        report.add("error", path, "Top-level structure must be a list of records", record_id="<file>")
+        add("error", path, "Top-level structure must be a list of records", record_id="<file>")
         return
 
     for record in data:
         if not isinstance(record, dict):
-            report.add("error", path, "Each record must be a mapping", record_id=str(record))
+            add("error", path, "Each record must be a mapping", record_id=str(record))
             continue
         record_id = record.get("id")
         if not record_id:
-            report.add("error", path, "Record missing 'id'", record_id="<unknown>")
+            add("error", path, "Record missing 'id'", record_id="<unknown>")
         else:
             if record_id in seen_ids:
-                report.add(
+                add(
                     "error",
                     path,
                     "Duplicate id detected",
                     record_id=record_id,
-                    first_occurrence=str(seen_ids[record_id].relative_to(ROOT)),
+                    first_occurrence=seen_ids[record_id],
                 )
             else:
-                seen_ids[record_id] = path
+                seen_ids[record_id] = _rel_to_root(str(path))
 
-    validate_record(record, path, registry, report, config, schema_root)
+        validate_record(record, path, registry, report, config, schema_root)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -329,26 +479,26 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     registry = EnumRegistry.load()
     report = ValidationReport()
-    seen_ids: Dict[str, Path] = {}
+    seen_ids: Dict[str, str] = {}
 
-    for file in iterate_inventory_files(schema_root):
-        validate_file(file, registry, report, seen_ids, config, schema_root)
+    files = list(iterate_inventory_files(schema_root))
+    for file, data in zip(files, cached_yaml_load_many(files)):
+        validate_file(file, registry, report, seen_ids, config, schema_root, data=data or [])
 
     if args.json:
         print(report.to_json())
     else:
-        for issue in report.issues:
-            rel = issue.file.relative_to(ROOT)
-            print(f"[{issue.level.upper()}] {rel}: {issue.message}")
+        for level, _, rel, message, _ in report.rows:
+            print(f"[{level.upper()}] {rel}: {message}")
 
-        if not report.issues:
+        if not report.rows:
             print("Inventory validation passed with no issues.")
         else:
             print(
-                f"Inventory validation completed with {len(report.errors)} error(s) and {len(report.warnings)} warning(s)."
+                f"Inventory validation completed with {report.count('error')} error(s) and {report.count('warning')} warning(s)."
             )
 
-    return 0 if not report.errors else 1
+    return 0 if not report.count("error") else 1
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,148 @@
+"""Parsed-YAML cache shared by the Repo Studios inventory scripts.
+
+`render_inventory_views.py` and `validate_inventory.py` are usually run
+back-to-back and both parse the whole schema tree. Parsed documents are cached
+in memory and pickled under `reports/.yaml_cache/`, keyed by
+`(path, st_mtime_ns, st_size)`, so unchanged files skip PyYAML entirely.
+
+Parsing and emitting go through the libyaml-backed `CSafeLoader`/`CSafeDumper`
+when PyYAML was built with them; otherwise a warning is raised once at import.
+Every PyYAML call in the inventory scripts goes through this module.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = ROOT / "reports" / ".yaml_cache"
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+    warnings.warn(
+        "PyYAML libyaml bindings unavailable; falling back to the pure-Python loader",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+CacheKey = Tuple[str, int, int]
+
+PARALLEL_MIN_FILES = 16
+
+_MEMORY: Dict[CacheKey, Any] = {}
+
+
+def _cache_file(path_str: str) -> Path:
+    digest = hashlib.sha1(path_str.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def _read_cached(cache_file: Path, key: CacheKey) -> Tuple[bool, Any]:
+    try:
+        with cache_file.open("rb") as fh:
+            payload = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return False, None
+    if not isinstance(payload, dict) or payload.get("key") != key:
+        return False, None
+    return True, payload.get("data")
+
+
+def _write_cached(cache_file: Path, key: CacheKey, data: Any) -> None:
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as fh:
+            pickle.dump({"key": key, "data": data}, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        # The cache is an optimisation only; a read-only tree must still work.
+        tmp.unlink(missing_ok=True)
+
+
+def _lookup(path_str: str) -> Tuple[CacheKey, bool, Any]:
+    stat = os.stat(path_str)
+    key: CacheKey = (path_str, stat.st_mtime_ns, stat.st_size)
+    if key in _MEMORY:
+        return key, True, _MEMORY[key]
+    found, data = _read_cached(_cache_file(path_str), key)
+    return key, found, data
+
+
+def _parse(path_str: str, key: CacheKey) -> Any:
+    # libyaml decodes the raw bytes itself; skip the Python-side text decode.
+    with open(path_str, "rb") as fh:
+        data = yaml.load(fh.read(), Loader=SafeLoader)
+    _write_cached(_cache_file(path_str), key, data)
+    return data
+
+
+def cached_yaml_load(path: Path) -> Any:
+    """Return the parsed contents of `path`, skipping the parse when unchanged.
+
+    The returned object is shared with the cache; callers must copy before mutating.
+    """
+    path_str = str(path)
+    key, found, data = _lookup(path_str)
+    if not found:
+        data = _parse(path_str, key)
+    _MEMORY[key] = data
+    return data
+
+
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def cached_yaml_load_many(paths: Sequence[Path]) -> List[Any]:
+    """Load several files in order, parsing cache misses in a process pool.
+
+    Small batches are parsed serially; below `PARALLEL_MIN_FILES` misses the
+    pool start-up costs more than it saves. A single usable CPU never gets a
+    pool either.
+    """
+    path_strs = [str(path) for path in paths]
+    lookups = [_lookup(path_str) for path_str in path_strs]
+    results = [data for _, _, data in lookups]
+    misses = [index for index, (_, found, _) in enumerate(lookups) if not found]
+    miss_paths = [path_strs[index] for index in misses]
+    miss_keys = [lookups[index][0] for index in misses]
+    workers = _usable_cpus()
+    if workers > 1 and len(misses) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=min(workers, len(misses))) as executor:
+            parsed = list(executor.map(_parse, miss_paths, miss_keys, chunksize=8))
+    else:
+        parsed = [_parse(path_str, key) for path_str, key in zip(miss_paths, miss_keys)]
+    for index, data in zip(misses, parsed):
+        results[index] = data
+    for (key, _, _), data in zip(lookups, results):
+        _MEMORY[key] = data
+    return results
+
+
+def dump_yaml(data: Any) -> bytes:
+    """Serialise `data` to UTF-8 in the block style used by every rendered inventory file.
+
+    The emitter encodes directly, so no intermediate `str` is built.
+    """
+    return yaml.dump(
+        data,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        encoding="utf-8",
+    )
@@ -1,27 +1,71 @@
 from __future__ import annotations
 
-import subprocess
+import contextlib
+import importlib.util
+import io
 import sys
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Callable
 
-VALIDATOR_PATH = Path(__file__).resolve().parents[1] / "tools" / "validate_inventory.py"
+import pytest
+
+from .schema_validation import utils
+
+VALIDATOR_PATH = Path(__file__).resolve().parents[1] / "scripts" / "inventory" / "validate_inventory.py"
+
+
+CANONICAL_ENUMS = {
+    "asset_kind": ["script"],
+    "roles": ["validator"],
+    "maturity": ["legacy"],
+    "consumers": ["coding_agent"],
+    "status": ["needs_review"],
+}
+
+
+@pytest.fixture(scope="session")
+def canonical_enums_yaml() -> bytes:
+    """`enums.yaml` content shared by the schema-validation tests, dumped once."""
+    return utils.dump_yaml(CANONICAL_ENUMS).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _validator_module() -> ModuleType:
+    """Import the validator once per session instead of spawning an interpreter per test."""
+    # The validator imports its sibling `yaml_cache` module.
+    sys.path.insert(0, str(VALIDATOR_PATH.parent))
+    spec = importlib.util.spec_from_file_location("validate_inventory", VALIDATOR_PATH)
+    assert spec is not None and spec.loader is not None, f"cannot load {VALIDATOR_PATH}"
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def validator_module() -> ModuleType:
+    """The imported `validate_inventory` module, for tests that call its helpers."""
+    return _validator_module()
 
 
 def load_validator(tmp_path: Path, json_output: bool = False) -> Callable[[], tuple[int, str]]:
     schema_root = tmp_path / "inventory_schema"
 
     def _run() -> tuple[int, str]:
-        args = [
-            sys.executable,
-            str(VALIDATOR_PATH),
-            "--schema-root",
-            str(schema_root),
-        ]
+        args = ["--schema-root", str(schema_root)]
         if json_output:
             args.append("--json")
-        proc = subprocess.run(args, capture_output=True, text=True, check=False)
-        stdout = proc.stdout.strip()
-        return proc.returncode, stdout
+        module = _validator_module()
+        buffer = io.StringIO()
+        # The validator reads enums from its module-level path, not from `--schema-root`.
+        with pytest.MonkeyPatch.context() as mp, contextlib.redirect_stdout(buffer):
+            mp.setattr(module, "ENUMS_PATH", schema_root / "enums.yaml")
+            try:
+                returncode = module.main(args)
+            except SystemExit as exc:
+                returncode = exc.code if isinstance(exc.code, int) else 1
+        return returncode, buffer.getvalue().strip()
 
     return _run
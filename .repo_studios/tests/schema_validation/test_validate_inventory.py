@@ -3,25 +3,19 @@ from pathlib import Path
 
 from . import utils  # type: ignore[attr-defined]
 
-from ..conftest import load_validator
+from ..conftest import CANONICAL_ENUMS, load_validator
 
 
 def write_yaml(path: Path, data):
     path.write_text(utils.dump_yaml(data), encoding="utf-8")
 
 
-def test_validation_passes_for_valid_entry(tmp_path: Path):
+def test_validation_passes_for_valid_entry(tmp_path: Path, canonical_enums_yaml: bytes):
     schema_root = tmp_path / "inventory_schema"
     schema_root.mkdir()
 
-    enums = {
-        "asset_kind": ["script"],
-        "roles": ["validator"],
-        "maturity": ["legacy"],
-        "consumers": ["coding_agent"],
-        "status": ["needs_review"],
-    }
-    write_yaml(schema_root / "enums.yaml", enums)
+    (schema_root / "enums.yaml").write_bytes(canonical_enums_yaml)
+    (tmp_path / "foo.py").write_text("", encoding="utf-8")
 
     records = [
         {
@@ -45,18 +39,11 @@ def test_validation_passes_for_valid_entry(tmp_path: Path):
     assert "Inventory validation passed" in stdout
 
 
-def test_validation_detects_duplicate_ids(tmp_path: Path):
+def test_validation_detects_duplicate_ids(tmp_path: Path, canonical_enums_yaml: bytes):
     schema_root = tmp_path / "inventory_schema"
     schema_root.mkdir()
 
-    enums = {
-        "asset_kind": ["script"],
-        "roles": ["validator"],
-        "maturity": ["legacy"],
-        "consumers": ["coding_agent"],
-        "status": ["needs_review"],
-    }
-    write_yaml(schema_root / "enums.yaml", enums)
+    (schema_root / "enums.yaml").write_bytes(canonical_enums_yaml)
 
     duplicate_records = [
         {
@@ -92,18 +79,11 @@ def test_validation_detects_duplicate_ids(tmp_path: Path):
     assert "Duplicate id" in stdout
 
 
-def test_json_output(tmp_path: Path):
+def test_json_output(tmp_path: Path, canonical_enums_yaml: bytes):
     schema_root = tmp_path / "inventory_schema"
     schema_root.mkdir()
 
-    enums = {
-        "asset_kind": ["script"],
-        "roles": ["validator"],
-        "maturity": ["legacy"],
-        "consumers": ["coding_agent"],
-        "status": ["needs_review"],
-    }
-    write_yaml(schema_root / "enums.yaml", enums)
+    (schema_root / "enums.yaml").write_bytes(canonical_enums_yaml)
 
     invalid_records = [
         {
@@ -127,3 +107,85 @@ def test_json_output(tmp_path: Path):
     payload = json.loads(stdout)
     assert payload["issues"][0]["level"] == "error"
     assert payload["issues"][0]["context"]["enum"] == "status"
+
+
+def test_every_record_is_validated(tmp_path: Path, canonical_enums_yaml: bytes):
+    schema_root = tmp_path / "inventory_schema"
+    schema_root.mkdir()
+
+    (schema_root / "enums.yaml").write_bytes(canonical_enums_yaml)
+
+    records = []
+    for record_id, status in (("scripts.first", "not_real"), ("scripts.second", "needs_review")):
+        (tmp_path / f"{record_id}.py").write_text("", encoding="utf-8")
+        records.append(
+            {
+                "id": record_id,
+                "name": record_id,
+                "path": f"{record_id}.py",
+                "asset_kind": "script",
+                "roles": ["validator"],
+                "maturity": "legacy",
+                "description": "Example",
+                "consumers": ["coding_agent"],
+                "status": status,
+                "artifact_type": "py",
+            }
+        )
+    write_yaml(schema_root / "records.yaml", records)
+
+    validator = load_validator(tmp_path, json_output=True)
+    rc, stdout = validator()
+    assert rc == 1
+    payload = json.loads(stdout)
+    assert [issue["context"]["record_id"] for issue in payload["issues"]] == ["scripts.first"]
+
+
+def test_compiled_record_check_matches_helpers(tmp_path: Path, validator_module):
+    v = validator_module
+    schema_root = tmp_path / "inventory_schema"
+    schema_root.mkdir()
+    (tmp_path / "exists.py").write_text("", encoding="utf-8")
+    registry = v.EnumRegistry(enums=CANONICAL_ENUMS)
+    config = v.ValidatorConfig(suppress_ids=("scripts.suppressed",))
+    file = schema_root / "records.yaml"
+
+    valid = {
+        "id": "scripts.valid",
+        "name": "Valid",
+        "path": "exists.py",
+        "asset_kind": "script",
+        "roles": ["validator"],
+        "maturity": "legacy",
+        "description": "Valid",
+        "consumers": ["coding_agent"],
+        "status": "needs_review",
+        "artifact_type": "py",
+    }
+    records = [
+        valid,
+        {},
+        {"id": "scripts.partial", "name": "Partial"},
+        {**valid, "roles": "validator", "tags": "x", "related_assets": None},
+        {**valid, "asset_kind": "doc", "roles": ["validator", "bogus"], "consumers": ["nobody"]},
+        {**valid, "maturity": "new", "status": "not_real"},
+        {**valid, "dependencies": "none"},
+        {**valid, "dependencies": {"internal_paths": "a", "external_tools": "b", "inputs": "c"}},
+        {**valid, "dependencies": {"inputs": [{"path": "a"}, {"name": "b"}, "c"]}},
+        {**valid, "path": "missing.py"},
+        {**valid, "path": 5},
+        {**valid, "id": "scripts.suppressed", "path": "missing.py"},
+        {**valid, "id": None},
+    ]
+    for record in records:
+        compiled = v.ValidationReport()
+        v.validate_record(record, file, registry, compiled, config, schema_root)
+
+        helpers = v.ValidationReport()
+        v._check_required_fields(record, file, helpers)
+        v._check_list_fields(record, file, helpers)
+        v._check_enums(record, file, registry, helpers)
+        v._check_dependencies(record, file, helpers)
+        v._check_paths(record, file, helpers, config, schema_root)
+
+        assert compiled.rows == helpers.rows, record
@@ -1,10 +1,9 @@
-import io
 from typing import Any
 
 import yaml
 
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def dump_yaml(data: Any) -> str:
-    buffer = io.StringIO()
-    yaml.safe_dump(data, buffer, default_flow_style=False, sort_keys=False)
-    return buffer.getvalue()
+    return yaml.dump(data, Dumper=_DUMPER, default_flow_style=False, sort_keys=False)
@@ -21,12 +21,28 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+import shutil
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-HEADING_RE = re.compile(r"^(#{1,2})\s+(.*)$")
+# Runs as a script from this directory, so the sibling module is importable; the
+# inventory and this report must agree on slugs, so the rules live in one place.
+from anchor_inventory import slugify as _slugify
+
+try:
+    import orjson  # optional: C encoder, writes bytes directly
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Matches H1/H2 headings anywhere in a file's raw bytes (MULTILINE), so files are
+# scanned with one `finditer` call and only heading text is ever decoded.
+HEADING_RE = re.compile(rb"^(#{1,2})[ \t]+(.*)$", re.MULTILINE)
 GENERIC_ALLOWED = {"overview", "introduction", "faq", "notes"}
 BASELINE_PATH = Path("tests/docs/anchor_slug_baseline.json")
 # Permanent root for anchor health artifacts (contains latest + historical runs)
@@ -36,13 +52,17 @@ OUTPUT_DIR = Path(".repo_studios/anchor_health")
 RUN_PREFIX = "anchor_health-"
 
 
-def _slugify(raw: str) -> str:
-    s = raw.strip().lower()
-    s = re.sub(r"`+", "", s)
-    s = re.sub(r"[^a-z0-9\- ]", "", s)
-    s = re.sub(r"\s+", "-", s)
-    s = re.sub(r"-+", "-", s)
-    return s.strip("-")
+def _walk_md(root: str) -> Iterator[str]:
+    """Yield markdown file paths under `root`, pruning `coverage_history/` subtrees."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "coverage_history":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry.path
 
 
 @dataclass
@@ -55,33 +75,33 @@ class Cluster:
         return len(self.files)
 
 
-def collect_h1_h2_slugs(skip: set[str] | None = None) -> dict[str, list[str]]:
+def _scan(md: str) -> list[str]:
+    """Return the H1/H2 slugs of one markdown file, in document order."""
+    with open(md, "rb") as fh:
+        data = fh.read()
+    if b"# " not in data and b"#\t" not in data:
+        return []  # every H1/H2 heading contains one of these; skip the regex
+    if b"\r" in data:
+        # "^"/"$" only break at "\n"; lone CR ends a line too, as in text mode.
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return [_slugify(m.group(2).decode("utf-8", "replace")) for m in HEADING_RE.finditer(data)]
+
+
+def collect_h1_h2_slugs(skip: set[str] | None = None) -> dict[str, set[str]]:
+    """Map each H1/H2 slug under docs/ to the set of files that define it."""
     root = Path("docs")
     assert root.exists(), "docs directory missing"
-    mapping: dict[str, list[str]] = {}
-    for md in root.rglob("*.md"):
-        if any(p in md.parts for p in ("coverage_history",)):
-            continue
-        for lineno, line in enumerate(md.read_text(encoding="utf-8", errors="replace").splitlines(), 1):
-            m = HEADING_RE.match(line)
-            if not m:
-                continue
-            if len(m.group(1)) > 2:
-                continue
-            slug = _slugify(m.group(2))
-            if skip and slug in skip:
-                continue
-            mapping.setdefault(slug, []).append(f"{md}:{lineno}")
-    return mapping
-
-
-def multi_file_duplicates(slug_map: dict[str, list[str]]) -> dict[str, list[str]]:
-    dupes: dict[str, list[str]] = {}
-    for slug, locs in slug_map.items():
-        files = {loc.split(":")[0] for loc in locs}
-        if len(files) > 1:
-            dupes[slug] = locs
-    return dupes
+    files = list(_walk_md(str(root)))
+    slug_files: defaultdict[str, set[str]] = defaultdict(set)
+    # Reads and regex scans release the GIL, so a thread pool overlaps them across
+    # files; the reduction stays on this thread so no locking is needed.
+    with ThreadPoolExecutor() as pool:
+        for md, slugs in zip(files, pool.map(_scan, files)):
+            for slug in slugs:
+                if skip and slug in skip:
+                    continue
+                slug_files[slug].add(md)
+    return slug_files
 
 
 def load_baseline() -> dict | None:
@@ -95,12 +115,10 @@ def load_baseline() -> dict | None:
 
 def build_report() -> dict:
     strict_map = collect_h1_h2_slugs(GENERIC_ALLOWED)
-    strict_dupes = multi_file_duplicates(strict_map)
-    clusters: list[Cluster] = []
-    for slug, locs in strict_dupes.items():
-        files = {loc.split(":")[0] for loc in locs}
-        clusters.append(Cluster(slug=slug, files=files))
-    clusters.sort(key=lambda c: (-c.file_count, c.slug))
+    clusters = sorted(
+        (Cluster(slug=slug, files=files) for slug, files in strict_map.items() if len(files) > 1),
+        key=lambda c: (-len(c.files), c.slug),
+    )
     baseline = load_baseline()
     baseline_dupes = baseline.get("summary", {}).get("cross_file_duplicates") if baseline else None
     return {
@@ -119,21 +137,41 @@ def build_report() -> dict:
     }
 
 
+def _json_bytes(data: dict) -> bytes:
+    """Indented, key-sorted JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
 def _run_dir(ts: datetime) -> Path:
     stamp = ts.strftime("%Y-%m-%d_%H%M")
     return OUTPUT_DIR / f"{RUN_PREFIX}{stamp}"
 
 
+def _publish(content: bytes, latest: Path, run_copy: Path) -> None:
+    """Atomically replace `latest` with `content`, then link it into the run folder."""
+    tmp = latest.with_name(f".tmp-{latest.name}")
+    tmp.write_bytes(content)
+    os.replace(tmp, latest)
+    run_copy.unlink(missing_ok=True)
+    try:
+        os.link(latest, run_copy)  # same inode when on the same filesystem
+    except OSError:
+        shutil.copyfile(latest, run_copy)
+
+
 def write_artifacts(report: dict, ts: datetime | None = None) -> Path:
     ts = ts or datetime.utcnow()
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     run_dir = _run_dir(ts)
     run_dir.mkdir(parents=True, exist_ok=True)
 
-    # Base JSON artifact (timestamped)
-    (run_dir / "anchor_report.json").write_text(
-        json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    # Each artifact is written once as the `*_latest` file; the timestamped run folder
+    # gets a hard link to it (or a copy where linking is not possible).
+    _publish(_json_bytes(report), OUTPUT_DIR / "anchor_report_latest.json", run_dir / "anchor_report.json")
 
     # Compact markdown summary
     lines = [
@@ -151,7 +189,11 @@ def write_artifacts(report: dict, ts: datetime | None = None) -> Path:
     lines.append("")
     lines.append("## Next Actions Guidance")
     lines.append("Prioritize largest clusters first; rename all but canonical file.")
-    (run_dir / "anchor_report.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _publish(
+        ("\n".join(lines) + "\n").encode("utf-8"),
+        OUTPUT_DIR / "anchor_report_latest.md",
+        run_dir / "anchor_report.md",
+    )
 
     # Full cluster listing for tooling consumption (tsv for quick grep)
     tsv_lines = ["slug\tfile_count\tfiles"]
@@ -159,24 +201,11 @@ def write_artifacts(report: dict, ts: datetime | None = None) -> Path:
         tsv_lines.append(
             f"{c['slug']}\t{c['file_count']}\t" + ",".join(c["files"])  # type: ignore[index]
         )
-    (run_dir / "clusters.tsv").write_text("\n".join(tsv_lines) + "\n", encoding="utf-8")
-
-    # Update latest symlink / copies
-    latest_json = OUTPUT_DIR / "anchor_report_latest.json"
-    latest_md = OUTPUT_DIR / "anchor_report_latest.md"
-    latest_tsv = OUTPUT_DIR / "clusters_latest.tsv"
-    for src, dest in [
-        (run_dir / "anchor_report.json", latest_json),
-        (run_dir / "anchor_report.md", latest_md),
-        (run_dir / "clusters.tsv", latest_tsv),
-    ]:
-        try:
-            if dest.exists():
-                dest.unlink()
-            dest.hardlink_to(src)  # fast copy when same FS
-        except Exception:
-            # Fallback copy
-            dest.write_bytes(src.read_bytes())
+    _publish(
+        ("\n".join(tsv_lines) + "\n").encode("utf-8"),
+        OUTPUT_DIR / "clusters_latest.tsv",
+        run_dir / "clusters.tsv",
+    )
 
     # Append to run log
     log_line = (
@@ -17,31 +17,47 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import re
-from collections import defaultdict
+import string
+from collections import Counter, defaultdict
 from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
-HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
-_slug_cleanup_re = re
+try:
+    import orjson  # optional: C encoder, writes bytes directly
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# H1/H2 only; deeper headings are never inventoried. MULTILINE lets `collect`
+# scan each file's raw bytes with a single `finditer` call.
+HEADING_RE = re.compile(rb"^(#{1,2})[ \t]+(.*)$", re.MULTILINE)
+# Slugs keep only [a-z0-9- ]: non-ASCII is dropped by an ascii encode, the rest of
+# ASCII by this table, then runs of spaces/dashes collapse to one dash.
+_SLUG_CHARS = string.ascii_lowercase + string.digits + "- "
+_SLUG_TABLE = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in _SLUG_CHARS))
+_SLUG_SEPARATORS_RE = re.compile(r"[ -]+")
+_QUOTED_RE = re.compile(r"\"([^\"]*)\"")
 
 
 def slugify(raw: str) -> str:
-    s = raw.strip().lower()
-    s = _slug_cleanup_re.sub(r"`+", "", s)
-    s = _slug_cleanup_re.sub(r"[^a-z0-9\- ]", "", s)
-    s = _slug_cleanup_re.sub(r"\s+", "-", s)
-    s = _slug_cleanup_re.sub(r"-+", "-", s)
-    return s.strip("-")
+    s = raw.lower().encode("ascii", "ignore").decode("ascii").translate(_SLUG_TABLE)
+    return _SLUG_SEPARATORS_RE.sub("-", s).strip("-")
 
 
-def iter_markdown_files(root: Path) -> Iterable[Path]:
-    for md in root.rglob("*.md"):
-        if any(p in md.parts for p in ("coverage_history",)):
-            continue
-        yield md
+def iter_markdown_files(root: Path) -> Iterable[str]:
+    """Yield markdown file paths under `root`, pruning `coverage_history/` subtrees."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "coverage_history":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry.path
 
 
 @dataclass
@@ -56,22 +72,23 @@ GENERIC_ALLOWED = {"overview", "introduction", "faq", "notes"}
 
 
 def collect(root: Path) -> dict[str, SlugStat]:
-    slug_locations: dict[str, list[str]] = defaultdict(list)
+    slug_files: defaultdict[str, set[str]] = defaultdict(set)
+    slug_counts: Counter[str] = Counter()
     for md in iter_markdown_files(root):
-        text = md.read_text(encoding="utf-8", errors="replace")
-        for lineno, line in enumerate(text.splitlines(), start=1):
-            m = HEADING_RE.match(line)
-            if not m:
-                continue
-            level = len(m.group(1))
-            if level > 2:
-                continue
-            slug = slugify(m.group(2))
-            slug_locations[slug].append(f"{md}:{lineno}")
+        with open(md, "rb") as fh:
+            data = fh.read()
+        if b"# " not in data and b"#\t" not in data:
+            continue  # every H1/H2 heading contains one of these; skip the regex
+        if b"\r" in data:
+            # "^"/"$" only break at "\n"; lone CR ends a line too, as in text mode.
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        for m in HEADING_RE.finditer(data):
+            slug = slugify(m.group(2).decode("utf-8", "replace"))
+            slug_files[slug].add(md)
+            slug_counts[slug] += 1
     stats: dict[str, SlugStat] = {}
-    for slug, locs in slug_locations.items():
-        files = sorted({loc.split(":")[0] for loc in locs})
-        stats[slug] = SlugStat(slug=slug, count=len(locs), file_count=len(files), files=files)
+    for slug, files in slug_files.items():
+        stats[slug] = SlugStat(slug=slug, count=slug_counts[slug], file_count=len(files), files=sorted(files))
     return stats
 
 
@@ -95,19 +112,20 @@ def parse_args() -> argparse.Namespace:
 def extract_test_allowlist_size(test_file: Path) -> int | None:
     if not test_file or not test_file.exists():  # type: ignore[arg-type]
         return None
-    text = test_file.read_text(encoding="utf-8", errors="replace")
     allowed_block: list[str] = []
     capture = False
-    for line in text.splitlines():
-        if line.strip().startswith("ALLOWED = {"):
-            capture = True
-            continue
-        if capture:
-            if line.strip().startswith("}"):
-                break
-            m = re.search(r"\"([^\"]*)\"", line)
-            if m:
-                allowed_block.append(m.group(1))
+    # Stream lines so reading stops as soon as the ALLOWED block closes.
+    with test_file.open(encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            if line.strip().startswith("ALLOWED = {"):
+                capture = True
+                continue
+            if capture:
+                if line.strip().startswith("}"):
+                    break
+                m = _QUOTED_RE.search(line)
+                if m:
+                    allowed_block.append(m.group(1))
     return len(allowed_block) if allowed_block else None
 
 
@@ -157,7 +175,10 @@ def maybe_write_json(
         "allowlist_size": allowlist_size,
     }
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
     log.info("Wrote baseline JSON: %s", path)
 
 
@@ -1,10 +1,12 @@
 import argparse
+import atexit
 import os
-import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import IO
 
 # === Configuration ===
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -16,6 +18,7 @@ CLEAN_LOG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = CLEAN_LOG_DIR / f"clean_{datetime.now().strftime('%Y-%m-%d_%H%M')}.txt"
 RUFF_CONFIG = str(PROJECT_ROOT / ".repo_studios" / "ruff_clean.toml")
 BACKUP = False  # Set True to copy original files before modifying
+BACKUP_PARALLEL_MIN = 16  # Fewer .py files than this are copied serially
 
 # Optional mode to run only a subset of checks (e.g., 'markdown')
 RUN_MODE = os.getenv("BATCH_CLEAN_ONLY", "all").lower()
@@ -73,41 +76,74 @@ MARKDOWNLINT_CHECK = [
 # === Helpers ===
 DRY_RUN = False
 
+# One buffered handle serves the whole run instead of an open/close per log write.
+_LOG: IO[str] | None = None
+
+
+def open_log(mode: str = "a") -> IO[str]:
+    """Open LOG_FILE once for the run; later calls return the same handle."""
+    global _LOG
+    if _LOG is None:
+        _LOG = open(LOG_FILE, mode, encoding="utf-8", buffering=1 << 16)
+        atexit.register(_LOG.close)
+    return _LOG
+
 
 def run_command(cmd: list[str], label: str) -> None:
-    with open(LOG_FILE, "a", encoding="utf-8") as log:
-        log.write(f"\n--- Running: {label} ---\n")
-        if DRY_RUN:
-            log.write("[dry-run] " + " ".join(cmd) + "\n")
-            result = None
-        else:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(PROJECT_ROOT),
-            )
-            log.write(result.stdout)
-            log.write(result.stderr)
-        import logging
+    log = open_log()
+    log.write(f"\n--- Running: {label} ---\n")
+    if DRY_RUN:
+        log.write("[dry-run] " + " ".join(cmd) + "\n")
+    else:
+        # The child writes straight into the log file (stderr interleaved with
+        # stdout), so flush our buffer first to keep the section header ahead of it.
+        log.flush()
+        subprocess.run(
+            cmd,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            cwd=str(PROJECT_ROOT),
+        )
+    import logging
 
-        logging.info(f"[✓] {label} {'(dry-run)' if DRY_RUN else 'complete'}")
+    logging.info(f"[✓] {label} {'(dry-run)' if DRY_RUN else 'complete'}")
 
 
-def backup_files(targets: list[str]) -> None:
-    import shutil
+def _iter_py_files(root: str):
+    """Yield `.py` file paths under `root` from cached DirEntry metadata."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
+def _backup_one(src: str) -> None:
+    # Backups are throwaway, so skip copy2's copystat (chmod/utime/xattr) pass.
+    shutil.copyfile(src, src + ".bak")
+
 
+def backup_files(targets: list[str]) -> None:
+    sources: list[str] = []
     for target in targets:
         if os.path.isfile(target):
             if target.endswith(".py"):
-                shutil.copy2(target, target + ".bak")
+                sources.append(target)
             continue
-        for root, _, files in os.walk(target):
-            for file in files:
-                if file.endswith(".py"):
-                    src = os.path.join(root, file)
-                    dst = os.path.join(root, file + ".bak")
-                    shutil.copy2(src, dst)
+        if os.path.isdir(target):
+            sources.extend(_iter_py_files(target))
+    # Copies are I/O bound and release the GIL; small batches stay serial.
+    if len(sources) < BACKUP_PARALLEL_MIN:
+        for src in sources:
+            _backup_one(src)
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() drains the results so a failed copy raises here.
+            list(pool.map(_backup_one, sources))
     import logging
 
     logging.info("[✓] Backup of .py files complete")
@@ -115,8 +151,7 @@ def backup_files(targets: list[str]) -> None:
 
 def run_markdownlint() -> None:
     """Run markdownlint fix and check if tooling is available."""
-    with open(LOG_FILE, "a", encoding="utf-8") as log:
-        log.write("\n--- Running: Markdownlint (Markdown formatting/lint) ---\n")
+    open_log().write("\n--- Running: Markdownlint (Markdown formatting/lint) ---\n")
 
     def _run(cmd: list[str], label: str) -> None:
         run_command(cmd, label)
@@ -158,6 +193,20 @@ def run_markdownlint() -> None:
     )
 
 
+_TREE_BEGIN = "<!-- tree:begin -->"
+_TREE_END = "<!-- tree:end -->"
+# Limit root files to a small set for signal
+_TREE_ROOT_FILES = frozenset(
+    {
+        "README.md",
+        "pyproject.toml",
+        "ruff.toml",
+        "pytest.ini",
+        "requirements-dev.txt",
+    }
+)
+
+
 def refresh_project_tree(
     md_file: Path,
     root_dir: Path,
@@ -180,43 +229,58 @@ def refresh_project_tree(
       exclude: Directory names to exclude (top-level match).
     """
 
-    def _is_excluded(path: Path) -> bool:
-        parts = set(path.parts)
-        return any(e in parts for e in exclude)
+    # A path is excluded when any of its parts is; below the root only the entry
+    # name can newly match, since excluded directories are never descended into.
+    root_excluded = any(e in root_dir.parts for e in exclude)
 
-    def _children(d: Path) -> list[Path]:
+    def _scan(dir_path: str) -> tuple[list[os.DirEntry[str]], list[os.DirEntry[str]]]:
+        """Return the sorted, non-hidden, non-excluded (dirs, files) of one directory."""
+        if root_excluded:
+            return [], []
+        dirs: list[os.DirEntry[str]] = []
+        files: list[os.DirEntry[str]] = []
         try:
-            return sorted([p for p in d.iterdir() if not p.name.startswith(".")])
-        except Exception:
-            return []
-
-    def _render_tree(dir_path: Path, depth: int, prefix: str = "") -> list[str]:
-        if depth > max_depth:
-            return []
-        lines: list[str] = []
-        if depth == 0:
-            lines.append(f"{dir_path.name}/")
-        entries = [p for p in _children(dir_path) if not _is_excluded(p)]
-        dirs = [p for p in entries if p.is_dir()]
-        files = [p for p in entries if p.is_file()]
-        # Limit root files to a small set for signal
-        root_files = {
-            "README.md",
-            "pyproject.toml",
-            "ruff.toml",
-            "pytest.ini",
-            "requirements-dev.txt",
-        }
-        if depth == 0 and files:
-            for f in files:
-                if f.name in root_files:
-                    lines.append(f"├── {f.name}")
-        # Render directories
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(".") or name in exclude:
+                        continue
+                    # DirEntry caches the type from readdir (symlinks still followed).
+                    if entry.is_dir():
+                        dirs.append(entry)
+                    elif entry.is_file():
+                        files.append(entry)
+        except OSError:
+            return [], []
+        dirs.sort(key=lambda e: e.name)
+        files.sort(key=lambda e: e.name)
+        return dirs, files
+
+    def _dir_items(dirs: list[os.DirEntry[str]], depth: int, prefix: str) -> list[tuple[str, str, int, str]]:
+        """One `(line, path, child_depth, child_prefix)` item per directory at `depth`."""
+        items = []
         for i, d in enumerate(dirs):
             connector = "└──" if i == len(dirs) - 1 and depth > 0 else "├──"
-            lines.append(f"{prefix}{connector} {d.name}/")
             child_prefix = prefix + ("    " if connector == "└──" else "│   ")
-            lines.extend(_render_tree(d, depth + 1, child_prefix))
+            items.append((f"{prefix}{connector} {d.name}/", d.path, depth + 1, child_prefix))
+        return items
+
+    def _render_tree(dir_path: Path) -> list[str]:
+        if max_depth < 0:
+            return []
+        lines = [f"{dir_path.name}/"]
+        dirs, files = _scan(str(dir_path))
+        for f in files:
+            if f.name in _TREE_ROOT_FILES:
+                lines.append(f"├── {f.name}")
+        # Depth-first with an explicit stack: each popped item emits its own line and
+        # queues its subdirectories (reversed, so they pop in sorted order).
+        stack = _dir_items(dirs, 0, "")[::-1]
+        while stack:
+            line, path, depth, prefix = stack.pop()
+            lines.append(line)
+            if depth <= max_depth:
+                stack.extend(_dir_items(_scan(path)[0], depth, prefix)[::-1])
         return lines
 
     if not md_file.exists():
@@ -225,36 +289,49 @@ def refresh_project_tree(
         _logging.info(f"[i] Tree refresh skipped (missing): {md_file}")
         return
 
-    text = md_file.read_text(encoding="utf-8")
-    start = text.find("<!-- tree:begin -->")
-    end = text.find("<!-- tree:end -->")
-    if start == -1 or end == -1 or end < start:
+    raw = md_file.read_bytes()
+    # Marker-less files (the common no-op case) are rejected before any decode.
+    if _TREE_BEGIN.encode() not in raw or _TREE_END.encode() not in raw:
         import logging as _logging
 
         _logging.info("[i] Tree markers not found; skipping refresh")
         return
+    text = raw.decode("utf-8")
+    start = text.find(_TREE_BEGIN)
+    end = text.find(_TREE_END)
+    if end < start:
+        import logging as _logging
 
-    lines = _render_tree(root_dir, 0)
+        _logging.info("[i] Tree markers not found; skipping refresh")
+        return
+
+    lines = _render_tree(root_dir)
     body = "\n".join(lines) + "\n"
     # Include a timestamp so the block visibly updates each run
     stamp = datetime.now().strftime("%m/%d/%Y_%H:%M:%S")
-    block = f"<!-- tree:begin -->\nUpdated: {stamp}\n```text\n{body}```\n<!-- tree:end -->"
-
-    # Replace existing block, preserving surrounding content
-    pattern = re.compile(
-        r"<!-- tree:begin -->[\s\S]*?<!-- tree:end -->",
-        flags=re.MULTILINE,
-    )
-    new_text = pattern.sub(block, text)
+    block = f"{_TREE_BEGIN}\nUpdated: {stamp}\n```text\n{body}```\n{_TREE_END}"
+
+    # Replace every begin..end block, preserving surrounding content; each begin
+    # pairs with the nearest end after it, as a non-greedy regex pass would.
+    pieces = []
+    pos = 0
+    while (start := text.find(_TREE_BEGIN, pos)) != -1:
+        end = text.find(_TREE_END, start + len(_TREE_BEGIN))
+        if end == -1:
+            break
+        pieces += (text[pos:start], block)
+        pos = end + len(_TREE_END)
+    pieces.append(text[pos:])
+    new_text = "".join(pieces)
     if new_text != text:
         md_file.write_text(new_text, encoding="utf-8")
-        with open(LOG_FILE, "a", encoding="utf-8") as log:
-            log.write("\n--- Running: Refresh project tree block ---\n")
-            log.write(f"Refreshed tree for: {root_dir} at {stamp}\n")
+        log = open_log()
+        log.write("\n--- Running: Refresh project tree block ---\n")
+        log.write(f"Refreshed tree for: {root_dir} at {stamp}\n")
     else:
-        with open(LOG_FILE, "a", encoding="utf-8") as log:
-            log.write("\n--- Running: Refresh project tree block ---\n")
-            log.write("No changes in tree block.\n")
+        log = open_log()
+        log.write("\n--- Running: Refresh project tree block ---\n")
+        log.write("No changes in tree block.\n")
 
 
 # === Main Cleanup Routine ===
@@ -321,13 +398,13 @@ if __name__ == "__main__":
 
     logging.basicConfig(level=logging.INFO)
     logging.info("🚀 Batch Cleanup Started...")
-    with open(LOG_FILE, "w", encoding="utf-8") as f:
-        f.write(
-            "# 🧼 repo Cleanup Log\n"
-            f"Timestamp: {datetime.now().isoformat()}\n"
-            f"Targets: {', '.join(norm_targets)}\n"
-            f"Mode: {mode}{' (dry-run)' if DRY_RUN else ''}\n\n"
-        )
+    # Truncate like before; the same handle then collects every later log write.
+    open_log("w").write(
+        "# 🧼 repo Cleanup Log\n"
+        f"Timestamp: {datetime.now().isoformat()}\n"
+        f"Targets: {', '.join(norm_targets)}\n"
+        f"Mode: {mode}{' (dry-run)' if DRY_RUN else ''}\n\n"
+    )
 
     if do_backup:
         backup_files(norm_targets)
@@ -339,8 +416,7 @@ if __name__ == "__main__":
     # If requested, stop after tree refresh
     if args.refresh_only:
         logging.info("✅ Tree refresh complete. Exiting as requested (--refresh-only).")
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write("\n[i] Exited after tree refresh due to --refresh-only flag.\n")
+        open_log().write("\n[i] Exited after tree refresh due to --refresh-only flag.\n")
         raise SystemExit(0)
 
     if mode == "markdown":
@@ -356,9 +432,8 @@ if __name__ == "__main__":
         if not args.no_pytest and os.getenv("BATCH_CLEAN_NO_PYTEST", "0") != "1":
             run_command(PYTEST, "Pytest (run tests)")
         else:
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(
-                    "\n[i] Skipping pytest as requested (--no-pytest or BATCH_CLEAN_NO_PYTEST=1).\n"
-                )
+            open_log().write(
+                "\n[i] Skipping pytest as requested (--no-pytest or BATCH_CLEAN_NO_PYTEST=1).\n"
+            )
 
     logging.info(f"✅ Cleanup complete. See {LOG_FILE} for details.")
@@ -34,6 +34,8 @@ import sys
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
@@ -44,6 +46,11 @@ except Exception as exc:  # pragma: no cover - dependency issue surfaced early
     logging.error("missing dependency pyyaml: %s", exc)
     sys.exit(1)
 
+try:  # libyaml-backed loader/dumper when PyYAML was built with it
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader  # type: ignore
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader  # type: ignore
+
 ROOT = Path(__file__).resolve().parent.parent
 INSTRUCTIONS_DIR = ROOT / ".repo_studios"
 CATEGORIES_FILE = INSTRUCTIONS_DIR / "standards_categories.yaml"
@@ -51,6 +58,7 @@ SEED_FILE = INSTRUCTIONS_DIR / "standards_seed.yaml"
 OUTPUT_FILE = ROOT / "repo_standards_index.yaml"
 PENDING_FILE = ROOT / "repo_standards_pending.yaml"
 SCHEMA_VERSION = 1
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 @dataclass
@@ -67,10 +75,32 @@ class Source:
     categories: list[str]
 
 
+def _existing_names(parent: Path) -> set[str]:
+    """Names of the entries in `parent` that exist, read with a single scandir."""
+    try:
+        with os.scandir(parent) as it:
+            # Dangling symlinks are listed by scandir but `Path.exists()` rejects them.
+            return {e.name for e in it if not e.is_symlink() or os.path.exists(e.path)}
+    except OSError:
+        return set()
+
+
+@lru_cache(maxsize=1)
+def _instructions_listing() -> set[str]:
+    return _existing_names(INSTRUCTIONS_DIR)
+
+
+def _instructions_file_exists(path: Path) -> bool:
+    """`path.exists()` for files in INSTRUCTIONS_DIR, served from one cached scandir."""
+    if path.parent != INSTRUCTIONS_DIR:
+        return path.exists()
+    return path.name in _instructions_listing()
+
+
 def _load_categories() -> tuple[dict[str, Category], list[Source]]:
-    if not CATEGORIES_FILE.exists():
+    if not _instructions_file_exists(CATEGORIES_FILE):
         raise FileNotFoundError(f"Category mapping file not found: {CATEGORIES_FILE}")
-    data = yaml.safe_load(CATEGORIES_FILE.read_text(encoding="utf-8"))
+    data = yaml.load(CATEGORIES_FILE.read_text(encoding="utf-8"), Loader=_SafeLoader)
     raw_categories = data.get("categories", {}) or {}
     categories: dict[str, Category] = {}
     for cid, meta in raw_categories.items():
@@ -88,7 +118,20 @@ def _load_categories() -> tuple[dict[str, Category], list[Source]]:
 
 
 def _validate_sources(categories: dict[str, Category], sources: list[Source]) -> None:
-    missing = [s for s in sources if not s.path.exists()]
+    # Sources cluster in a few directories, so list each parent once rather than
+    # stat-ing every source path.
+    listings: dict[Path, set[str]] = {INSTRUCTIONS_DIR: _instructions_listing()}
+    missing: list[Source] = []
+    for s in sources:
+        if s.path.name == "..":
+            present = s.path.exists()
+        else:
+            names = listings.get(s.path.parent)
+            if names is None:
+                names = listings[s.path.parent] = _existing_names(s.path.parent)
+            present = s.path.name in names
+        if not present:
+            missing.append(s)
     if missing:
         missing_str = ", ".join(str(m.path) for m in missing)
         raise FileNotFoundError(f"Missing source files: {missing_str}")
@@ -99,9 +142,14 @@ def _validate_sources(categories: dict[str, Category], sources: list[Source]) ->
 
 
 def _compute_integrity_hash(rule_fragments: list[str]) -> str:
-    # Deterministic hash: join fragments with \n and sha256
-    joined = "\n".join(rule_fragments)
-    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+    # Deterministic hash: sha256 of the fragments joined with \n, fed incrementally
+    # so no joined copy of all fragments is built
+    h = hashlib.sha256()
+    for i, fragment in enumerate(rule_fragments):
+        if i:
+            h.update(b"\n")
+        h.update(fragment.encode("utf-8"))
+    return h.hexdigest()
 
 
 def _build_empty_rules_hash() -> str:
@@ -122,8 +170,8 @@ def _env_flag(name: str, default: str = "0") -> bool:
 def _load_seed_rules() -> tuple[list[dict[str, Any]], set[str]]:
     rules: list[dict[str, Any]] = []
     seed_ids: set[str] = set()
-    if SEED_FILE.exists():
-        seed_data = yaml.safe_load(SEED_FILE.read_text(encoding="utf-8")) or {}
+    if _instructions_file_exists(SEED_FILE):
+        seed_data = yaml.load(SEED_FILE.read_text(encoding="utf-8"), Loader=_SafeLoader) or {}
         for r in seed_data.get("rules", []) or []:
             rules.append(r)
             if r.get("id"):
@@ -143,15 +191,17 @@ class ExtractDiagnostics(TypedDict, total=False):
 ExtractFn = Callable[[Path, list[str], set[str], str | None], tuple[list[dict[str, Any]], ExtractDiagnostics]]
 
 
+@lru_cache(maxsize=1)
 def _dynamic_import_extract() -> ExtractFn:  # pragma: no cover - best effort
     """Load the extraction function via a controlled exec sandbox.
 
     Rationale: importlib spec loader proved flaky in some environments (returned a
     spec without a loader). For a repo‑local, trusted module this simplified path
     is acceptable and more reliable. Falls back to a stub if any exception occurs.
+    The result is cached, so the module is executed at most once per process.
     """
     spec_path = INSTRUCTIONS_DIR / "standards_extraction.py"
-    if not spec_path.exists():
+    if not _instructions_file_exists(spec_path):
         def _absent(_: Path, __: list[str], ___: set[str], today: str | None = None):  # type: ignore[unused-ignore]
             return [], {"notes": ["extraction module not present"]}
         return cast(ExtractFn, _absent)
@@ -233,8 +283,8 @@ def _write_pending_file(extracted_all: list[dict[str, Any]], auto_accept: bool,
         "diagnostics": extraction_diags,
     }
     try:  # pragma: no cover - IO
-        with PENDING_FILE.open("w", encoding="utf-8") as pf:
-            yaml.safe_dump(payload, pf, sort_keys=False, width=100)
+        with PENDING_FILE.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as pf:
+            yaml.dump(payload, pf, Dumper=_SafeDumper, sort_keys=False, width=100)
     except Exception as exc:  # pragma: no cover
         logging.error("failed to write pending file: %s", exc)
 
@@ -242,7 +292,7 @@ def _write_pending_file(extracted_all: list[dict[str, Any]], auto_accept: bool,
 def _compute_rules_hash(rules: list[dict[str, Any]]) -> str:
     if not rules:
         return _build_empty_rules_hash()
-    fragments = [f"{r['id']}|{r['last_updated']}|{r['severity']}" for r in sorted(rules, key=lambda x: x['id'])]
+    fragments = [f"{r['id']}|{r['last_updated']}|{r['severity']}" for r in sorted(rules, key=itemgetter("id"))]
     return _compute_integrity_hash(fragments)
 
 
@@ -299,7 +349,7 @@ def build_index() -> dict[str, Any]:
                 **({"description": c.description} if c.description else {}),
                 **({"tags": c.tags} if c.tags else {}),
             }
-            for cid, c in sorted(categories.items(), key=lambda kv: kv[0])
+            for cid, c in sorted(categories.items(), key=itemgetter(0))
         },
         "rules": rules,
         "coverage": {"source_stats": {}, "missing_sections": []},
@@ -310,8 +360,9 @@ def build_index() -> dict[str, Any]:
 
 def write_index(index: dict[str, Any]) -> None:
     # Preserve key order by constructing final dict intentionally (PyYAML >=5 preserves insertion order)
-    with OUTPUT_FILE.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(index, f, sort_keys=False, width=100)
+    # The emitter writes in small pieces; a 1 MiB buffer turns them into a few large writes.
+    with OUTPUT_FILE.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        yaml.dump(index, f, Dumper=_SafeDumper, sort_keys=False, width=100)
 
 
 def main() -> int:
@@ -36,39 +36,53 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import string
 import sys
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 RE_MD_LINK = re.compile(r"metrics_orchestrator\.md#([a-zA-Z0-9\-._]+)")
 RE_HEADING = re.compile(r"^(#{2,6})\s+(.*)$")
+_RE_WS = re.compile(r"\s+")
+# Anchors keep only [a-z0-9._-]: non-ASCII is dropped by an ascii encode, the rest of
+# ASCII by this table.
+_ANCHOR_CHARS = string.ascii_lowercase + string.digits + "._-"
+_ANCHOR_TABLE = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in _ANCHOR_CHARS))
 
 ROOT = Path(__file__).resolve().parent.parent
 LEGACY_FILE = ROOT / "docs/api/metrics_orchestrator.md"
+EXCLUDED_TOP_DIRS = {"vendor", "external"}
 
 
 def _normalize_anchor(text: str) -> str:
-    # Basic GitHub-style anchor normalization
-    t = text.strip().lower()
-    # remove backticks
-    t = t.replace("`", "")
-    # replace spaces with hyphens
-    t = re.sub(r"\s+", "-", t)
-    # drop chars not alnum, dash, underscore, dot
-    t = re.sub(r"[^a-z0-9._-]", "", t)
-    return t
+    # Basic GitHub-style anchor normalization: backticks go first (so whitespace on
+    # either side of one collapses into a single hyphen), whitespace runs become
+    # hyphens, then everything outside alnum, dash, underscore and dot is dropped.
+    t = _RE_WS.sub("-", text.strip().lower().replace("`", ""))
+    return t.encode("ascii", "ignore").decode("ascii").translate(_ANCHOR_TABLE)
+
+
+def _file_anchors(p: Path) -> set[str]:
+    try:
+        data = p.read_bytes()
+    except Exception:
+        return set()
+    # Most files never mention the target doc; skip their decode and regex scan.
+    if b"metrics_orchestrator.md" not in data:
+        return set()
+    text = data.decode("utf-8", errors="ignore")
+    return {m.group(1).lower() for m in RE_MD_LINK.finditer(text)}
 
 
 def collect_referenced_anchors(paths: Iterable[Path]) -> set[str]:
     anchors: set[str] = set()
-    for p in paths:
-        try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        for m in RE_MD_LINK.finditer(text):
-            anchors.add(m.group(1).lower())
+    # Files are independent, so reads overlap on a thread pool; the union stays here.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for found in pool.map(_file_anchors, paths):
+            anchors |= found
     return anchors
 
 
@@ -83,7 +97,12 @@ def collect_legacy_stub_anchors() -> set[str]:
 
     in_legacy_block = False
     for line in lines:
-        if line.strip().lower().startswith("## legacy anchor compatibility"):
+        # Only lines opening with "##" can toggle the legacy block or be a heading;
+        # everything else (most of the file) is skipped before any regex work.
+        head = line.lstrip()
+        if not head.startswith("##"):
+            continue
+        if head.lower().startswith("## legacy anchor compatibility"):
             in_legacy_block = True
             continue
         if (
@@ -103,13 +122,25 @@ def collect_legacy_stub_anchors() -> set[str]:
 
 
 def iter_markdown_files() -> Iterable[Path]:
-    for path in ROOT.rglob("*.md"):
-        rel = path.relative_to(ROOT)
-        if any(part.startswith(".") for part in rel.parts):
-            continue
-        if rel.parts[0] in {"vendor", "external"}:
+    # Hidden entries (any depth) and top-level vendor/external trees are pruned
+    # before descending, so .git, .venv etc. are never listed.
+    stack = [(str(ROOT), True)]
+    while stack:
+        current, top_level = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
             continue
-        yield path
+        with it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if not (top_level and name in EXCLUDED_TOP_DIRS):
+                        stack.append((entry.path, False))
+                elif name.endswith(".md") and entry.is_file():
+                    yield Path(entry.path)
 
 
 def main() -> int:
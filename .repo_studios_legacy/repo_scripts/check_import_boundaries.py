@@ -21,10 +21,12 @@ Exit code
   - 1 on violations not covered by allowlist
 
 Usage
-  python .repo_studios/check_import_boundaries.py [--repo-root .]
+  python .repo_studios/check_import_boundaries.py [--repo-root .] [--fast-fail]
 
 Env
   STRICT=1 can be used by CI to treat warnings as errors in the future.
+  FAST_FAIL=1 is the same as --fast-fail: the static scan stops once every rule has a
+  violation outside the allowlist (the exit code is unchanged; the listing may be partial).
 """
 
 from __future__ import annotations
@@ -33,10 +35,20 @@ import argparse
 import json
 import logging
 import os
+import re
+import shutil
+import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # optional: C parser, reads bytes directly
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 HERE = Path(__file__).resolve().parent
 ROOT = HERE.parent
 GRAPH_DIR = HERE / "import_graph"
@@ -48,23 +60,32 @@ class Violation:
     kind: str  # "cycle" | "edge" | "static-import"
     detail: str
     file: str | None = None
+    src: str | None = None  # edge endpoints, set by edge producers
+    dst: str | None = None
 
 
 def _latest_graph_json() -> Path | None:
-    if not GRAPH_DIR.exists():
+    # Pick the lexicographically latest timestamp dir (one pass over the listing)
+    try:
+        with os.scandir(GRAPH_DIR) as it:
+            latest = max((e.name for e in it if e.is_dir()), default=None)
+    except OSError:
         return None
-    # Pick the lexicographically latest timestamp dir
-    dirs = [p for p in GRAPH_DIR.iterdir() if p.is_dir()]
-    if not dirs:
+    if latest is None:
         return None
-    latest = sorted(dirs)[-1]
-    cand = latest / "graph.json"
+    cand = GRAPH_DIR / latest / "graph.json"
     return cand if cand.exists() else None
 
 
+def _load_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
 def _load_graph(path: Path) -> dict[str, list[str]]:
     try:
-        return json.loads(path.read_text())
+        return _load_json(path)
     except Exception:
         return {}
 
@@ -73,7 +94,7 @@ def _load_allowlist(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {"edges": [], "files": []}
     try:
-        return json.loads(path.read_text())
+        return _load_json(path)
     except Exception:
         return {"edges": [], "files": []}
 
@@ -83,35 +104,155 @@ def _is_test_file(p: Path) -> bool:
     return "/tests/" in r or r.endswith("/tests")
 
 
+SKIP_DIRS = {
+    ".venv",
+    "venv",
+    "node_modules",
+    "external",
+    "libraries",
+    "voice_profile",
+    "zzz_agent_repos",
+    "z_Files to upload",
+    "z_FUTURE_IMPIMENTATIONS",
+    "__pycache__",
+    ".repo_studios",
+    "backups",
+}
+
+# A `from`/`import` statement of a guarded package at the start of any line (indented
+# or not); group 1 is the package. The same pattern drives the ripgrep pass.
+_IMPORT_RE = re.compile(rb"^[ \t]*(?:from|import)[ \t]+(api|agents\.interface)\b", re.MULTILINE)
+
+# Per layer, the imported packages it may not use and the violation each produces:
+#   agents → api forbidden; agents/core → agents/interface forbidden;
+#   api → agents/interface discouraged (enforceable when STRICT=1 later).
+_LAYER_RULES: dict[str, tuple[tuple[str, str], ...]] = {
+    "agents_core": (
+        ("api", "agents -> api"),
+        ("agents.interface", "agents/core -> agents/interface"),
+    ),
+    "agents": (("api", "agents -> api"),),
+    "api": (("agents.interface", "api -> agents/interface"),),
+}
+
+
+STATIC_RULES = frozenset(detail for rules in _LAYER_RULES.values() for _, detail in rules)
+# Byte needles per layer: a file containing none of its layer's package names cannot
+# match _IMPORT_RE for a relevant package, so the regex pass is skipped.
+_LAYER_NEEDLES = {
+    layer: tuple(package.encode("ascii") for package, _ in rules)
+    for layer, rules in _LAYER_RULES.items()
+}
+
+
+def _layer(rel: str) -> str | None:
+    """Classify a repo-relative posix path into a `_LAYER_RULES` key (None: unchecked)."""
+    if rel.startswith("agents/"):
+        return "agents_core" if rel.startswith("agents/core/") else "agents"
+    if rel.startswith("api/"):
+        return "api"
+    return None
+
+
+def _file_violations(rel: str, layer: str, imported: set[str]) -> list[Violation]:
+    return [
+        Violation(kind="static-import", detail=detail, file=rel)
+        for package, detail in _LAYER_RULES[layer]
+        if package in imported
+    ]
+
+
+def _rg_import_hits(repo_root: Path) -> dict[str, set[str]] | None:
+    """Map rel path -> {"api", "agents.interface"} via one ripgrep run; None if rg is unusable."""
+    rg = shutil.which("rg")
+    if rg is None:
+        return None
+    cmd = [
+        rg,
+        "--no-config",
+        "--no-ignore",
+        "--hidden",
+        "--text",
+        "--encoding=none",
+        "--no-heading",
+        "--with-filename",
+        "--line-number",
+        "--null",
+        "--only-matching",
+        "-g",
+        "*.py",
+    ]
+    for d in sorted(SKIP_DIRS):
+        cmd += ["-g", f"!{d}/"]
+    cmd += ["-e", _IMPORT_RE.pattern.decode()]
+    try:
+        proc = subprocess.run(cmd, cwd=repo_root, capture_output=True, check=False)
+    except OSError:
+        return None
+    # 0 = matches, 1 = none; anything else (bad flags, old rg) falls back to the Python scan.
+    if proc.returncode not in (0, 1):
+        return None
+    return _parse_rg_hits(proc.stdout.decode("utf-8", "surrogateescape"))
+
+
+def _parse_rg_hits(out: str) -> dict[str, set[str]]:
+    hits: dict[str, set[str]] = {}
+    for line in out.splitlines():
+        path, _, rest = line.partition("\0")
+        _, _, match = rest.partition(":")
+        if not match:
+            continue
+        token = "agents.interface" if "agents.interface" in match else "api"
+        hits.setdefault(path, set()).add(token)
+    return hits
+
+
 def _scan_static_imports(repo_root: Path) -> list[Violation]:
+    return list(_iter_static_violations(repo_root))
+
+
+def _scan_static_imports_fast(repo_root: Path, allowed_files: set[str]) -> list[Violation]:
+    """Like `_scan_static_imports`, but stop once every rule has fired outside the allowlist.
+
+    Allowlisted violations are still collected on the way, so the agents -> api flag and
+    the final (post-allowlist) outcome match a full scan.
+    """
+    out: list[Violation] = []
+    fired: set[str] = set()
+    for v in _iter_static_violations(repo_root):
+        out.append(v)
+        if v.file not in allowed_files:
+            fired.add(v.detail)
+            if fired >= STATIC_RULES:
+                break
+    return out
+
+
+def _iter_static_violations(repo_root: Path) -> Iterator[Violation]:
     """Scan for disallowed static imports by path and content patterns.
 
     Rules:
-    - agents/** importing api/* (forbidden): look for 'from api' or 'import api' tokens.
+    - agents/** importing api/* (forbidden): look for 'from api' or 'import api' statements.
     - agents/core/** importing agents/interface/** (forbidden):
         'from agents.interface' or 'import agents.interface'
     - api/** importing agents/interface/** (discouraged):
         'from agents.interface' or 'import agents.interface' (tests excluded).
     Tests are exempt. Non-.py files ignored. Vendor or external dirs can be ignored via a simple skip.
+
+    Uses a single ripgrep pass when `rg` is on PATH and a Python walk otherwise.
     """
-    violations: list[Violation] = []
-    skip_dirs = {
-        ".venv",
-        "venv",
-        "node_modules",
-        "external",
-        "libraries",
-        "voice_profile",
-        "zzz_agent_repos",
-        "z_Files to upload",
-        "z_FUTURE_IMPIMENTATIONS",
-        "__pycache__",
-        ".repo_studios",
-        "backups",
-    }
+    hits = _rg_import_hits(repo_root)
+    if hits is not None:
+        for rel in sorted(hits):
+            layer = _layer(rel)
+            if layer is None or _is_test_file(repo_root / rel):
+                continue
+            yield from _file_violations(rel, layer, hits[rel])
+        return
+    candidates: list[tuple[str, str, Path]] = []
     for dirpath, dirnames, filenames in os.walk(repo_root):
         # prune skip dirs
-        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
         for fn in filenames:
             if not fn.endswith(".py"):
                 continue
@@ -119,57 +260,96 @@ def _scan_static_imports(repo_root: Path) -> list[Violation]:
             if _is_test_file(fp):
                 continue
             rel = fp.relative_to(repo_root).as_posix()
-            try:
-                text = fp.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+            layer = _layer(rel)
+            if layer is None:
+                continue  # no rule applies, so the file is never read
+            candidates.append((rel, layer, fp))
+    # Reads overlap on threads (blocking read() releases the GIL); matching stays on
+    # this thread, in walk order.
+    pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    try:
+        contents = pool.map(_read_bytes, [fp for _, _, fp in candidates])
+        for (rel, layer, _), data in zip(candidates, contents):
+            if data is None or not any(n in data for n in _LAYER_NEEDLES[layer]):
                 continue
-            # Rule: agents → api forbidden
-            if rel.startswith("agents/"):
-                if "\nfrom api " in text or "\nimport api" in text:
-                    violations.append(
-                        Violation(
-                            kind="static-import",
-                            detail="agents -> api",
-                            file=rel,
-                        )
-                    )
-            # Rule: agents/core → agents/interface forbidden
-            if rel.startswith("agents/core/"):
-                if "\nfrom agents.interface" in text or "\nimport agents.interface" in text:
-                    violations.append(
-                        Violation(
-                            kind="static-import",
-                            detail="agents/core -> agents/interface",
-                            file=rel,
-                        )
-                    )
-            # Rule: api → agents/interface discouraged (enforceable when STRICT=1 later)
-            if rel.startswith("api/"):
-                if "\nfrom agents.interface" in text or "\nimport agents.interface" in text:
-                    violations.append(
-                        Violation(
-                            kind="static-import",
-                            detail="api -> agents/interface",
-                            file=rel,
-                        )
-                    )
-    return violations
+            imported = {m.decode("ascii") for m in _IMPORT_RE.findall(data)}
+            yield from _file_violations(rel, layer, imported)
+    finally:
+        # A fast-fail consumer may stop early; reads not yet started are dropped.
+        pool.shutdown(cancel_futures=True)
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except Exception:
+        return None
+
+
+# Top-level namespace pairs that must not end up in the same import cycle.
+CYCLE_PAIRS = (("api", "agents"),)
+
+
+def _sccs(graph: dict[str, list[str]]) -> list[set[str]]:
+    """Strongly connected components of `graph` (iterative Tarjan, O(V + E))."""
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    out: list[set[str]] = []
+    for start in graph:
+        if start in index:
+            continue
+        index[start] = low[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(graph.get(start, ())))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.get(child, ()))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    scc: set[str] = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        scc.add(member)
+                        if member == node:
+                            break
+                    out.append(scc)
+    return out
 
 
 def _detect_cycles(
     graph: dict[str, list[str]], *, agents_to_api_forbidden_found: bool
 ) -> list[Violation]:
-    # Coarse cycles on top-level namespaces present in graph keys
+    # Coarse cycles on top-level namespaces: one SCC pass, then each guarded pair is
+    # a lookup (same component of size > 1 means a direct or indirect cycle).
     v: list[Violation] = []
-    # Specific: api ⇄ agents
-    if "api" in graph and "agents" in graph:
-        api_edges = set(graph.get("api", []))
-        ag_edges = set(graph.get("agents", []))
-        # Only consider a cycle a violation when the disallowed direction
-        # (agents -> api) is present in source files; api -> agents by itself
-        # is permitted by layering and should not be flagged.
-        if agents_to_api_forbidden_found and "agents" in api_edges and "api" in ag_edges:
-            v.append(Violation(kind="cycle", detail="api <-> agents"))
+    # Only consider a cycle a violation when the disallowed direction (agents -> api)
+    # is present in source files; api -> agents by itself is permitted by layering
+    # and should not be flagged.
+    if not agents_to_api_forbidden_found:
+        return v
+    component: dict[str, int] = {}
+    for i, scc in enumerate(_sccs(graph)):
+        if len(scc) > 1:
+            component.update(dict.fromkeys(scc, i))
+    for a, b in CYCLE_PAIRS:
+        if a in component and component[a] == component.get(b):
+            v.append(Violation(kind="cycle", detail=f"{a} <-> {b}"))
     return v
 
 
@@ -180,7 +360,7 @@ def _edge_violation_edges(
     v: list[Violation] = []
     if agents_to_api_forbidden_found and "agents" in graph:
         if "api" in set(graph.get("agents", [])):
-            v.append(Violation(kind="edge", detail="agents -> api"))
+            v.append(Violation(kind="edge", detail="agents -> api", src="agents", dst="api"))
     # Intra-agents inversion is best caught by static file scan; keep here for parity later
     return v
 
@@ -188,23 +368,16 @@ def _edge_violation_edges(
 def _apply_allowlist(violations: list[Violation], allow: dict[str, Any]) -> list[Violation]:
     allowed_edges = {(e.get("from"), e.get("to")) for e in allow.get("edges", [])}
     allowed_files = set(allow.get("files", []))
+    # cycles are allowed only if both directed edges are allowlisted
+    cycle_allowed = {("api", "agents"), ("agents", "api")} <= allowed_edges
     out: list[Violation] = []
     for v in violations:
-        if v.kind in {"edge", "cycle"}:
-            # cycles are allowed only if both directed edges are allowlisted
-            if v.kind == "edge":
-                parts = v.detail.split("->")
-                if len(parts) == 2:
-                    src = parts[0].strip()
-                    dst = parts[1].strip()
-                    if (src, dst) in allowed_edges:
-                        continue
-            if v.kind == "cycle":
-                if ("api", "agents") in allowed_edges and ("agents", "api") in allowed_edges:
-                    continue
-        if v.kind == "static-import" and v.file:
-            if v.file in allowed_files:
-                continue
+        if v.kind == "edge" and v.src is not None and (v.src, v.dst) in allowed_edges:
+            continue
+        if v.kind == "cycle" and cycle_allowed:
+            continue
+        if v.kind == "static-import" and v.file and v.file in allowed_files:
+            continue
         out.append(v)
     return out
 
@@ -212,6 +385,12 @@ def _apply_allowlist(violations: list[Violation], allow: dict[str, Any]) -> list
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--repo-root", default=str(ROOT))
+    ap.add_argument(
+        "--fast-fail",
+        action="store_true",
+        default=os.getenv("FAST_FAIL") == "1",
+        help="Stop the static scan once every rule has a non-allowlisted violation",
+    )
     args = ap.parse_args()
     repo_root = Path(args.repo_root).resolve()
 
@@ -220,7 +399,10 @@ def main() -> int:
     allow = _load_allowlist(ALLOWLIST_PATH)
 
     # First run static scan (source only, tests excluded)
-    static_violations = _scan_static_imports(repo_root)
+    if args.fast_fail:
+        static_violations = _scan_static_imports_fast(repo_root, set(allow.get("files", [])))
+    else:
+        static_violations = _scan_static_imports(repo_root)
     agents_to_api_forbidden_found = any(
         v.kind == "static-import" and v.detail == "agents -> api" for v in static_violations
     )
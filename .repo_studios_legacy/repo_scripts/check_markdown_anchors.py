@@ -17,7 +17,12 @@ Exit codes:
   1 - issues found (printed)
 
 Usage:
-  python scripts/check_markdown_anchors.py [--root .] [--glob docs/**/*.md]
+  python scripts/check_markdown_anchors.py [--root .] [--glob docs/**/*.md] [--no-cache]
+                                           [--jobs N]
+
+Heading anchors are cached in <root>/.repo_studios/markdown_anchors.cache.json and
+reused while a file's mtime and size are unchanged. Only files whose anchors a run
+needed are kept, and a cache written by different heading/slug rules is discarded.
 
 Defaults choose a curated file set (README + docs/agents/*quickstart* + step5 plan).
 """
@@ -25,15 +30,33 @@ Defaults choose a curated file set (README + docs/agents/*quickstart* + step5 pl
 from __future__ import annotations
 
 import argparse
+import functools
+import json
 import logging
+import mmap
+import os
 import re
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
-HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
-LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")  # capture link target
+# Byte patterns run over a whole memory-mapped file (MULTILINE), so only captured
+# groups are ever decoded. Character classes exclude CR/LF to keep every match on
+# one line, as the previous per-line scan did. Quantifiers are possessive (3.11+):
+# each run stops at a character its class excludes, so giving characters back could
+# never produce a match, and an unclosed "[" or a 7-hash line fails without backtracking.
+HEADING_RE = re.compile(rb"^(#{1,6}+)[ \t\f\v]++(.*)$", re.MULTILINE)
+LINK_RE = re.compile(rb"\[[^\]\r\n]++\]\(([^)\r\n]++)\)")  # capture link target
+# Heading anchors persisted between runs, keyed by file path and validated against
+# the file's (mtime_ns, size); resolved against --root.
+CACHE_PATH = Path(".repo_studios/markdown_anchors.cache.json")
+# Cached anchors are only valid for the rules that produced them: bump CACHE_FORMAT
+# when the entry layout or slugify() changes (HEADING_RE is part of the key).
+CACHE_FORMAT = 2
+CACHE_KEY = f"{CACHE_FORMAT}:{HEADING_RE.flags}:{HEADING_RE.pattern.decode('ascii')}"
 
 
 class Issue(NamedTuple):
@@ -44,6 +67,8 @@ class Issue(NamedTuple):
     message: str
 
 
+# Link targets repeat heavily (many links into the same few docs), so slugs are memoized.
+@functools.lru_cache(maxsize=8192)
 def slugify(raw: str) -> str:
     s = raw.strip().lower()
     # remove code spans/backticks
@@ -55,13 +80,82 @@ def slugify(raw: str) -> str:
     return s.strip("-")
 
 
-def collect_anchors(text: str) -> set[str]:
-    anchors: set[str] = set()
-    for line in text.splitlines():
-        m = HEADING_RE.match(line)
-        if not m:
-            continue
-        anchors.add(slugify(m.group(2)))
+@contextmanager
+def _mmap(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield a read-only map of `path` (empty files cannot be mapped; they yield b"").
+
+    Files containing CR are yielded as a copy with CRLF and lone CR turned into LF, so
+    line numbers and "^"/"$" follow universal newlines, as text-mode reading did.
+    """
+    with path.open("rb") as fh:
+        try:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+        with buf:
+            if buf.find(b"\r") != -1:
+                yield buf[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            else:
+                yield buf
+
+
+def collect_anchors(buf: bytes | mmap.mmap) -> set[str]:
+    return {slugify(m.group(2).decode("utf-8", "replace")) for m in HEADING_RE.finditer(buf)}
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    """Return the cached entries, or {} if the file is unreadable or has another key."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("key") != CACHE_KEY:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(path: Path, cache: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".tmp-{path.name}")
+        tmp.write_text(
+            json.dumps({"key": CACHE_KEY, "files": cache}, sort_keys=True), encoding="utf-8"
+        )
+        os.replace(tmp, path)
+    except OSError as exc:  # cache is best effort
+        logging.debug("Could not write anchor cache %s: %s", path, exc)
+
+
+def _cached_anchors(
+    path: Path,
+    anchors_cache: dict[Path, set[str]],
+    disk_cache: dict[str, Any] | None,
+    buf: bytes | mmap.mmap | None = None,
+) -> set[str]:
+    """Return the heading anchors of `path`, parsing it only on a cache miss."""
+    anchors = anchors_cache.get(path)
+    if anchors is not None:
+        return anchors
+    key = str(path)
+    stamp: list[int] | None = None
+    if disk_cache is not None:
+        st = path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = disk_cache.get(key)
+        if isinstance(entry, list) and len(entry) == 3 and entry[:2] == stamp:
+            anchors = set(entry[2])
+    if anchors is None:
+        if buf is None:
+            with _mmap(path) as mapped:
+                anchors = collect_anchors(mapped)
+        else:
+            anchors = collect_anchors(buf)
+        if stamp is not None:
+            # Overwrites any entry whose stamp no longer matches the file.
+            disk_cache[key] = [*stamp, sorted(anchors)]  # type: ignore[index]
+    anchors_cache[path] = anchors
     return anchors
 
 
@@ -74,23 +168,47 @@ def iter_files(patterns: Iterable[str], root: Path) -> Iterable[Path]:
                 yield path
 
 
-def parse_links(text: str) -> Iterable[tuple[int, str]]:
-    for idx, line in enumerate(text.splitlines(), start=1):
-        for m in LINK_RE.finditer(line):
-            yield idx, m.group(1)
+def parse_links(buf: bytes | mmap.mmap) -> Iterable[tuple[int, str]]:
+    # Matches arrive in order, so line numbers advance by counting newlines between
+    # them (a slice, since mmap has no count(); the slices add up to one file pass).
+    line_no, pos = 1, 0
+    for m in LINK_RE.finditer(buf):
+        start = m.start()
+        line_no += buf[pos:start].count(b"\n")
+        pos = start
+        yield line_no, m.group(1).decode("utf-8", "replace")
+
+
+def check_file(
+    path: Path,
+    root: Path,
+    anchors_cache: dict[Path, set[str]],
+    disk_cache: dict[str, Any] | None = None,
+) -> list[Issue]:
+    with _mmap(path) as buf:
+        return _check_buffer(path, buf, root, anchors_cache, disk_cache)
 
 
-def check_file(path: Path, root: Path, anchors_cache: dict[Path, set[str]]) -> list[Issue]:
+def _check_buffer(
+    path: Path,
+    buf: bytes | mmap.mmap,
+    root: Path,
+    anchors_cache: dict[Path, set[str]],
+    disk_cache: dict[str, Any] | None,
+) -> list[Issue]:
     issues: list[Issue] = []
-    text = path.read_text(encoding="utf-8", errors="replace")
-    for line_no, target in parse_links(text):
+    # Containment is a string prefix test on normalized paths; with a trailing
+    # separator the root itself also passes.
+    root_prefix = os.path.join(str(root.resolve()), "")
+    parent = str(path.parent)
+    for line_no, target in parse_links(buf):
         if target.startswith(("http://", "https://", "mailto:")):
             continue  # external
         if target.startswith("#"):
             # intra-file anchor
             anchor = target[1:]
             anchor_slug = slugify(anchor)
-            anchors = anchors_cache.setdefault(path, collect_anchors(text))
+            anchors = _cached_anchors(path, anchors_cache, disk_cache, buf)
             if anchor_slug not in anchors:
                 issues.append(
                     Issue(
@@ -105,18 +223,17 @@ def check_file(path: Path, root: Path, anchors_cache: dict[Path, set[str]]) -> l
         # file or file#anchor
         file_part, _, anchor_part = target.partition("#")
         # normalize relative path
-        target_path = (path.parent / file_part).resolve()
-        try:
-            target_path.relative_to(root.resolve())
-        except ValueError:
+        target_str = os.path.normpath(os.path.join(parent, file_part))
+        if not os.path.join(target_str, "").startswith(root_prefix):
             # outside root; skip for safety
             continue
-        if not target_path.exists():
-            issues.append(Issue(path, line_no, "file", target, "Target file does not exist"))
-            continue
         if anchor_part:
-            tgt_text = target_path.read_text(encoding="utf-8", errors="replace")
-            anchors = anchors_cache.setdefault(target_path, collect_anchors(tgt_text))
+            # Reading the anchors doubles as the existence check.
+            try:
+                anchors = _cached_anchors(Path(target_str), anchors_cache, disk_cache)
+            except (FileNotFoundError, NotADirectoryError):
+                issues.append(Issue(path, line_no, "file", target, "Target file does not exist"))
+                continue
             slug = slugify(anchor_part)
             if slug not in anchors:
                 issues.append(
@@ -128,6 +245,8 @@ def check_file(path: Path, root: Path, anchors_cache: dict[Path, set[str]]) -> l
                         f"Missing anchor slug '{slug}' in target file",
                     )
                 )
+        elif not os.path.exists(target_str):
+            issues.append(Issue(path, line_no, "file", target, "Target file does not exist"))
     return issues
 
 
@@ -140,6 +259,17 @@ def main(argv: list[str]) -> int:
         help="Glob pattern (repeatable)",
         dest="globs",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) * 4),
+        help="Files checked concurrently (reads overlap on threads; 1 = serial)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or update the on-disk anchor cache (<root>/{CACHE_PATH})",
+    )
     args = parser.parse_args(argv)
     root = Path(args.root).resolve()
     patterns = args.globs or [
@@ -147,10 +277,29 @@ def main(argv: list[str]) -> int:
         "docs/agents/config_quickstart.md",
         "docs/agents/step5_agent_config_system.md",
     ]
+    cache_path = root / CACHE_PATH
+    disk_cache = None if args.no_cache else _load_cache(cache_path)
+    cache_before = dict(disk_cache) if disk_cache is not None else None
     anchors_cache: dict[Path, set[str]] = {}
     all_issues: list[Issue] = []
-    for md_file in iter_files(patterns, root):
-        all_issues.extend(check_file(md_file, root, anchors_cache))
+    md_files = list(iter_files(patterns, root))
+    if args.jobs > 1 and len(md_files) > 1:
+        # The caches are plain dicts: a race only means a file's anchors are parsed
+        # twice. map() keeps results in file order, so the report is unchanged.
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            for issues in pool.map(
+                lambda f: check_file(f, root, anchors_cache, disk_cache), md_files
+            ):
+                all_issues.extend(issues)
+    else:
+        for md_file in md_files:
+            all_issues.extend(check_file(md_file, root, anchors_cache, disk_cache))
+    if disk_cache is not None:
+        # Keep only files whose anchors this run read; entries for deleted or
+        # no-longer-linked files are dropped.
+        fresh = {key: disk_cache[key] for key in map(str, anchors_cache) if key in disk_cache}
+        if fresh != cache_before:
+            _save_cache(cache_path, fresh)
     if all_issues:
         logging.error("Markdown anchor/link issues detected (%d)", len(all_issues))
         for issue in all_issues:
@@ -166,7 +315,7 @@ def main(argv: list[str]) -> int:
         return 1
     logging.info(
         "All checked markdown anchors OK (files: %s)",
-        ", ".join(str(p.relative_to(root)) for p in anchors_cache),
+        ", ".join(sorted(str(p.relative_to(root)) for p in anchors_cache)),
     )
     return 0
 
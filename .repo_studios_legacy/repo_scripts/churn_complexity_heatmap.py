@@ -10,31 +10,58 @@ Computes a simple per-file risk score by combining:
 Outputs (under --output-base/<ts>/):
 - heatmap.json
 - heatmap.md
+
+Churn counts are cached in --output-base/.churn_cache.json per (HEAD commit, window)
+and reused until HEAD moves; pass --no-cache to recompute.
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
 import json
 import logging
 import math
+import os
 import subprocess
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # optional: C encoder, writes bytes directly
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
 
-def _run(cmd: list[str], cwd: Path | None = None) -> tuple[int, str]:
-    proc = subprocess.Popen(
-        cmd,
-        cwd=str(cwd) if cwd else None,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    out, _ = proc.communicate()
-    return proc.returncode, out
+try:
+    from lxml import etree as lxml_etree  # optional: streaming libxml2 parser
+except ModuleNotFoundError:  # pragma: no cover
+    lxml_etree = None  # type: ignore
+
+# Below this many files (or on a single CPU) scoring stays in-process; pool start-up
+# and pickling would cost more than the parallel AST parsing saves.
+PARALLEL_MIN_FILES = 64
+
+# Per-HEAD churn counts persisted between runs (under --output-base).
+CHURN_CACHE_NAME = ".churn_cache.json"
+
+# Node types counted as branches by the complexity proxy (exact-type set lookup).
+BRANCH_NODES = frozenset(
+    {
+        ast.If,
+        ast.For,
+        ast.AsyncFor,
+        ast.While,
+        ast.Try,
+        ast.With,
+        ast.BoolOp,
+        ast.IfExp,
+        ast.Match,
+    }
+)
 
 
 def _ensure_out(base: Path) -> Path:
@@ -47,65 +74,142 @@ def _ensure_out(base: Path) -> Path:
 def _py_files(root: Path) -> list[Path]:
     ignores = {".venv", ".git", "__pycache__", "node_modules"}
     out: list[Path] = []
-    for p in root.rglob("*.py"):
-        if any(seg in ignores for seg in p.parts):
-            continue
-        out.append(p)
+    # Ignored directories are pruned before descending rather than filtered afterwards.
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in ignores]
+        base = Path(dirpath)
+        out.extend(base / fn for fn in filenames if fn.endswith(".py"))
     return out
 
 
 def _commit_churn(root: Path, window: int) -> Counter[str]:
-    _, out = _run(
-        ["git", "--no-pager", "log", f"-n{window}", "--name-only", "--pretty=format:"], cwd=root
+    # -z frames each path with NUL (unquoted, no blank-line heuristics); the pipe is
+    # consumed in chunks so a large window is never held in memory as one string.
+    proc = subprocess.Popen(
+        ["git", "--no-pager", "log", f"-n{window}", "--name-only", "--pretty=format:", "-z"],
+        cwd=str(root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
     )
-    files = [
-        line.strip() for line in out.splitlines() if line.strip() and line.strip().endswith(".py")
-    ]
-    return Counter(files)
+    assert proc.stdout is not None
+    counts: Counter[str] = Counter()
+    tail = b""
+    with proc.stdout as stream:
+        for chunk in iter(lambda: stream.read(1 << 16), b""):
+            fields = (tail + chunk).split(b"\0")
+            tail = fields.pop()
+            counts.update(
+                f.decode("utf-8", "surrogateescape") for f in fields if f.endswith(b".py")
+            )
+    proc.wait()
+    if tail.endswith(b".py"):
+        counts[tail.decode("utf-8", "surrogateescape")] += 1
+    return counts
 
 
-def _complexity_score(path: Path) -> int:
-    import ast
+def _git_head(root: Path) -> str | None:
+    proc = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=str(root), capture_output=True, text=True, check=False
+    )
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.strip() or None
 
+
+def _cached_commit_churn(root: Path, window: int, cache_path: Path) -> Counter[str]:
+    """`_commit_churn`, reusing counts stored for the current HEAD and window.
+
+    The log of the last `window` commits is fully determined by HEAD, so only a new
+    HEAD invalidates an entry; entries for older HEADs are dropped on write.
+    """
+    head = _git_head(root)
+    if head is None:
+        return _commit_churn(root, window)
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+    per_head = cache.get(head) if isinstance(cache, dict) else None
+    if not isinstance(per_head, dict):
+        per_head = {}
+    hit = per_head.get(str(window))
+    if isinstance(hit, dict):
+        return Counter(hit)
+    churn = _commit_churn(root, window)
+    per_head[str(window)] = dict(churn)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f".tmp-{cache_path.name}")
+        tmp.write_text(json.dumps({head: per_head}), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError as exc:  # cache is best effort
+        logging.debug("Could not write churn cache %s: %s", cache_path, exc)
+    return churn
+
+
+def _complexity_score(path: Path) -> int:
     try:
         tree = ast.parse(path.read_text(encoding="utf-8", errors="ignore"))
     except Exception:
         return 0
+    # Explicit stack instead of ast.walk's generator; order does not matter for a count.
     count = 0
-    branch_nodes = (
-        ast.If,
-        ast.For,
-        ast.AsyncFor,
-        ast.While,
-        ast.Try,
-        ast.With,
-        ast.BoolOp,
-        ast.IfExp,
-        ast.Match,
-    )
-    for node in ast.walk(tree):
-        if isinstance(node, branch_nodes):
+    stack: list[ast.AST] = [tree]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        node = pop()
+        if type(node) in BRANCH_NODES:
             count += 1
+        push(ast.iter_child_nodes(node))
     return count
 
 
-def _junit_failures(junit: Path | None) -> Counter[str]:
-    from defusedxml import ElementTree
+def _complexity_scores(files: list[Path]) -> list[int]:
+    """Score `files` in order, across worker processes when it is worth it."""
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(files) < PARALLEL_MIN_FILES:
+        return [_complexity_score(p) for p in files]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_complexity_score, files, chunksize=32))
 
+
+def _count_failure(c: Counter[str], tc: Any) -> None:
+    if tc.find("failure") is not None or tc.find("error") is not None:
+        file_attr = tc.get("file")
+        classname = tc.get("classname")
+        left = file_attr or (classname.replace(".", "/") + ".py" if classname else None)
+        if left:
+            c[left] += 1
+
+
+def _junit_failures(junit: Path | None) -> Counter[str]:
     c: Counter[str] = Counter()
     if not junit:
         return c
+    if lxml_etree is not None:
+        # Stream <testcase> elements and free each once counted, so memory stays flat
+        # however large the report. Entity expansion and network access stay off.
+        try:
+            for _, tc in lxml_etree.iterparse(
+                str(junit), events=("end",), tag="testcase", resolve_entities=False, no_network=True
+            ):
+                _count_failure(c, tc)
+                tc.clear(keep_tail=True)
+                while tc.getprevious() is not None:
+                    del tc.getparent()[0]
+        except Exception:
+            return Counter()  # unreadable report: no partial counts, as before
+        return c
+
+    from defusedxml import ElementTree
+
     try:
         root = ElementTree.parse(junit).getroot()
     except Exception:
         return c
     for tc in root.iterfind(".//testcase"):
-        if tc.find("failure") is not None or tc.find("error") is not None:
-            file_attr = tc.get("file")
-            classname = tc.get("classname")
-            left = file_attr or (classname.replace(".", "/") + ".py" if classname else None)
-            if left:
-                c[left] += 1
+        _count_failure(c, tc)
     return c
 
 
@@ -115,6 +219,11 @@ def main() -> int:
     ap.add_argument("--window", type=int, default=500, help="git log window (number of commits)")
     ap.add_argument("--output-base", default=".repo_studios/churn_complexity")
     ap.add_argument("--logs-dir", default=".repo_studios/pytest_logs")
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always run git log instead of reusing --output-base/{CHURN_CACHE_NAME}",
+    )
     args = ap.parse_args()
 
     root = Path(args.repo_root).resolve()
@@ -128,17 +237,23 @@ def main() -> int:
     junit_candidates = sorted((p for p in logs_dir.glob("junit_*.xml")), key=lambda p: p.name)
     junit = junit_candidates[-1] if junit_candidates else None
 
-    churn = _commit_churn(root, args.window)
+    if args.no_cache:
+        churn = _commit_churn(root, args.window)
+    else:
+        churn = _cached_commit_churn(root, args.window, out_base / CHURN_CACHE_NAME)
     failures = _junit_failures(junit)
 
+    files = _py_files(root)
+    # _py_files walks from `root`, so relative paths are a prefix slice away.
+    prefix_len = len(os.path.join(str(root), ""))
+    log1p = math.log1p
     results: list[dict[str, Any]] = []
-    for py in _py_files(root):
-        rel = str(py.relative_to(root))
-        comp = _complexity_score(py)
+    for py, comp in zip(files, _complexity_scores(files)):
+        rel = str(py)[prefix_len:]
         ch = churn[rel]
         fail = failures[rel]
         # Simple normalized score: log1p(churn)*log1p(complexity)*(1+fail)
-        score = math.log1p(ch) * math.log1p(comp) * (1 + fail)
+        score = log1p(ch) * log1p(comp) * (1 + fail)
         results.append(
             {
                 "file": rel,
@@ -150,28 +265,27 @@ def main() -> int:
         )
 
     # Sort by score desc
-    results.sort(key=lambda x: x["score"], reverse=True)
+    results.sort(key=itemgetter("score"), reverse=True)
+
+    generated = datetime.now().isoformat()
 
     # JSON
-    (out_dir / "heatmap.json").write_text(
-        json.dumps(
-            {"generated_at": datetime.now().isoformat(), "window": args.window, "items": results},
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
+    payload = {"generated_at": generated, "window": args.window, "items": results}
+    if orjson is not None:
+        (out_dir / "heatmap.json").write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        (out_dir / "heatmap.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
-    # Markdown top 25
-    md: list[str] = []
-    md.append("# Churn × Complexity Heatmap\n")
-    md.append(f"Generated: {datetime.now().isoformat()}\n")
-    md.append(f"Window: last {args.window} commits\n")
-    md.append("\n| File | Churn | Complexity | Failures | Score |\n|---|---:|---:|---:|---:|\n")
-    for item in results[:25]:
-        md.append(
-            f"| {item['file']} | {item['churn']} | {item['complexity']} | {item['failures']} | {item['score']:.4f} |\n"
-        )
-    (out_dir / "heatmap.md").write_text("".join(md), encoding="utf-8")
+    # Markdown top 25, written row by row
+    with (out_dir / "heatmap.md").open("w", encoding="utf-8") as md:
+        md.write("# Churn × Complexity Heatmap\n")
+        md.write(f"Generated: {generated}\n")
+        md.write(f"Window: last {args.window} commits\n")
+        md.write("\n| File | Churn | Complexity | Failures | Score |\n|---|---:|---:|---:|---:|\n")
+        for item in results[:25]:
+            md.write(
+                f"| {item['file']} | {item['churn']} | {item['complexity']} | {item['failures']} | {item['score']:.4f} |\n"
+            )
 
     logging.info("Heatmap written to %s", out_dir)
     return 0
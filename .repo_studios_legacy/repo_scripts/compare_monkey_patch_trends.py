@@ -24,12 +24,18 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # optional: C parser, reads bytes directly
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 BASE_DIR_DEFAULT = Path(".repo_studios/monkey_patch")
 REPORT_NAME = "report.json"
 
@@ -38,39 +44,80 @@ REPORT_NAME = "report.json"
 class Scan:
     ts: str
     dir: Path
-    findings: list[dict[str, Any]]
+    # None once an older scan is reduced to its `overview` row (see _find_scans).
+    findings: list[dict[str, Any]] | None
+    overview: dict[str, Any] | None = None
+
+
+def _load_report(path: Path) -> Any:
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8 or NaN; the lenient stdlib path decides
+    return json.loads(data.decode("utf-8", errors="ignore"))
 
 
-def _find_scans(base_dir: Path) -> list[Scan]:
+def _find_scans(base_dir: Path, limit: int | None = None, keep_findings: int = 2) -> list[Scan]:
+    """Load scans oldest first; with `limit`, only the newest `limit` are parsed.
+
+    Directories are visited newest first. Beyond the newest `keep_findings` scans
+    (the ones the deltas need), findings are reduced to the overview row as soon as
+    they are parsed, so at most that many findings lists are held at once.
+    """
     scans: list[Scan] = []
-    if not base_dir.exists():
+    try:
+        with os.scandir(base_dir) as it:
+            # DirEntry.is_dir() answers from the directory listing where it can.
+            names = sorted((e.name for e in it if e.is_dir()), reverse=True)
+    except OSError:
         return scans
-    for child in sorted(base_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        rep = child / REPORT_NAME
-        if not rep.exists():
-            continue
+    for name in names:
+        if limit is not None and len(scans) >= limit:
+            break
+        child = base_dir / name
         try:
-            data = json.loads(rep.read_text(encoding="utf-8", errors="ignore"))
-            if not isinstance(data, list):
-                continue
-            scans.append(Scan(ts=child.name, dir=child, findings=data))
+            # A missing report fails the open, which replaces a separate exists() probe.
+            data = _load_report(child / REPORT_NAME)
         except Exception:
             continue
-    scans.sort(key=lambda s: s.ts)
+        if not isinstance(data, list):
+            continue
+        scan = Scan(ts=child.name, dir=child, findings=data)
+        if len(scans) >= keep_findings:
+            _reduce(scan)
+        scans.append(scan)
+    scans.reverse()
     return scans
 
 
+def _overview(scan: Scan, by_cat: Counter, policy: tuple[int, Counter, Counter, Counter]) -> dict:
+    policy_total, policy_by_cat, _, _ = policy
+    return {
+        "ts": scan.ts,
+        "dir": str(scan.dir),
+        "total": len(scan.findings or ()),
+        "by_category": dict(by_cat),
+        # Policy-focused metrics (non-test only)
+        "policy_total": policy_total,
+        "policy_by_category": dict(policy_by_cat),
+    }
+
+
+def _reduce(scan: Scan) -> None:
+    """Keep only the overview row of `scan` (all the summary needs from older scans)."""
+    findings = scan.findings or []
+    by_cat, _, _ = _agg_counts(findings)
+    scan.overview = _overview(scan, by_cat, _agg_policy_counts(findings))
+    scan.findings = None
+
+
 def _agg_counts(findings: list[dict[str, Any]]) -> tuple[Counter, Counter, Counter]:
-    by_cat: Counter[str] = Counter()
-    by_import: Counter[str] = Counter()
-    by_file: Counter[str] = Counter()
-    for f in findings:
-        by_cat[f.get("category") or "<unknown>"] += 1
-        base = f.get("import_base") or "<none>"
-        by_import[str(base)] += 1
-        by_file[str(f.get("file") or "<unknown>")] += 1
+    # Counter(iterable) tallies in C; three generator passes beat one Python-level loop.
+    by_cat: Counter[str] = Counter(f.get("category") or "<unknown>" for f in findings)
+    by_import: Counter[str] = Counter(str(f.get("import_base") or "<none>") for f in findings)
+    by_file: Counter[str] = Counter(str(f.get("file") or "<unknown>") for f in findings)
     return by_cat, by_import, by_file
 
 
@@ -99,28 +146,25 @@ def _fmt_table(rows: list[tuple[str, int, int, int]], headers: tuple[str, str, s
 
 def _mk_summary(scans: list[Scan]) -> dict[str, Any]:
     summary: dict[str, Any] = {"scans": [], "latest_vs_prev": None}
-    for s in scans:
-        by_cat, _, _ = _agg_counts(s.findings)
-        policy_total, policy_by_cat, _, _ = _agg_policy_counts(s.findings)
-        summary["scans"].append(
-            {
-                "ts": s.ts,
-                "dir": str(s.dir),
-                "total": len(s.findings),
-                "by_category": dict(by_cat),
-                # Policy-focused metrics (non-test only)
-                "policy_total": policy_total,
-                "policy_by_category": dict(policy_by_cat),
-            }
-        )
+    # Scans still holding findings are aggregated once; the latest two reuse their
+    # results for the deltas. Reduced (older) scans contribute their stored row.
+    aggs: dict[int, tuple[Counter, Counter, Counter]] = {}
+    policies: dict[int, tuple[int, Counter, Counter, Counter]] = {}
+    for i, s in enumerate(scans):
+        if s.findings is None and s.overview is not None:
+            summary["scans"].append(s.overview)
+            continue
+        aggs[i] = _agg_counts(s.findings or [])
+        policies[i] = _agg_policy_counts(s.findings or [])
+        summary["scans"].append(_overview(s, aggs[i][0], policies[i]))
     if len(scans) < 2:
         return summary
     prev, cur = scans[-2], scans[-1]
-    p_cat, p_imp, p_file = _agg_counts(prev.findings)
-    c_cat, c_imp, c_file = _agg_counts(cur.findings)
+    p_cat, p_imp, p_file = aggs[len(scans) - 2]
+    c_cat, c_imp, c_file = aggs[len(scans) - 1]
     # Policy (non-test) aggregates
-    p_policy_total, p_policy_cat, _, _ = _agg_policy_counts(prev.findings)
-    c_policy_total, c_policy_cat, _, _ = _agg_policy_counts(cur.findings)
+    p_policy_total, p_policy_cat, _, _ = policies[len(scans) - 2]
+    c_policy_total, c_policy_cat, _, _ = policies[len(scans) - 1]
     # Build rows sorted by |delta| desc
     all_cats = sorted(set(p_cat) | set(c_cat))
     rows = []
@@ -150,12 +194,12 @@ def _mk_summary(scans: list[Scan]) -> dict[str, Any]:
     summary["latest_vs_prev"] = {
         "prev": {
             "ts": prev.ts,
-            "total": len(prev.findings),
+            "total": len(prev.findings or ()),
             "policy_total": p_policy_total,
         },
         "cur": {
             "ts": cur.ts,
-            "total": len(cur.findings),
+            "total": len(cur.findings or ()),
             "policy_total": c_policy_total,
         },
         "by_category_rows": rows,
@@ -272,7 +316,7 @@ def main(argv: list[str] | None = None) -> int:
     base_dir = Path(args.base_dir)
     if not base_dir.is_absolute():
         base_dir = Path.cwd() / base_dir
-    scans = _find_scans(base_dir)
+    scans = _find_scans(base_dir, limit=args.max_scans if args.max_scans > 0 else None)
     if not scans:
         logging.warning("No scans found under %s", base_dir)
         return 1
@@ -16,6 +16,7 @@ import datetime as dt
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
@@ -31,6 +32,15 @@ REQ_PATTERNS = (
     "requirements/*.txt",
 )
 
+_VCS_PREFIX = r"git\+|hg\+|svn\+|bzr\+"
+_VCS_RE = re.compile(_VCS_PREFIX)
+_EXACT_VERSION_RE = re.compile(r"\d+\.\d+(\.\d+)?")
+# One match per requirement line: empty lookahead groups flag a VCS or local-path
+# prefix, and `name` is everything before the first version-specifier character.
+_REQ_LINE_RE = re.compile(
+    rf"(?:(?P<vcs>(?={_VCS_PREFIX}))|(?P<local>(?=\./|\.\.|/)))?(?P<name>[^<>=!~]*)"
+)
+
 
 @dataclass
 class Issue:
@@ -61,13 +71,14 @@ def _parse_requirements_file(path: Path) -> tuple[list[Issue], dict[str, list[st
         if line.startswith(("-e ", "--editable")):
             issues.append(Issue("editable_install", str(path), i, raw))
             continue
-        if re.match(r"^(git\+|hg\+|svn\+|bzr\+)", line):
+        m = _REQ_LINE_RE.match(line)
+        if m["vcs"] is not None:
             issues.append(Issue("vcs_ref", str(path), i, raw))
-        if re.match(r"^\./|^\.\.|^/", line):
+        elif m["local"] is not None:
             issues.append(Issue("local_path", str(path), i, raw))
 
-        # Split on version specifiers
-        name = re.split(r"[<>=!~]", line)[0].strip()
+        # Name: the text before any version specifier
+        name = m["name"].strip()
         if name:
             seen.setdefault(name.lower(), []).append(line)
         # Pinning check: prefer '==' exact pins
@@ -95,10 +106,10 @@ def _parse_pyproject(path: Path) -> list[Issue]:
         items = [(d, d) for d in deps]
     for raw_name, spec in items:
         # Consider spec pinned if contains '==' or is an exact version string
-        pinned = "==" in spec or re.fullmatch(r"\d+\.\d+(\.\d+)?", spec) is not None
+        pinned = "==" in spec or _EXACT_VERSION_RE.fullmatch(spec) is not None
         if not pinned:
             issues.append(Issue("unpinned", str(path), 0, f"{raw_name} {spec}"))
-        if re.match(r"^(git\+|hg\+|svn\+|bzr\+)", spec):
+        if _VCS_RE.match(spec):
             issues.append(Issue("vcs_ref", str(path), 0, f"{raw_name} {spec}"))
     return issues
 
@@ -140,9 +151,14 @@ def main() -> int:
     out = out_base / dt.datetime.now().strftime("%Y-%m-%d_%H%M")
 
     all_issues: list[Issue] = []
-    # requirements files
-    for rf in _iter_req_files(root):
-        issues, _ = _parse_requirements_file(rf)
+    # requirements files: parsed on a thread pool so reads overlap; map() keeps file order
+    req_files = _iter_req_files(root)
+    if len(req_files) > 1:
+        with ThreadPoolExecutor() as ex:
+            parsed = list(ex.map(_parse_requirements_file, req_files))
+    else:
+        parsed = [_parse_requirements_file(rf) for rf in req_files]
+    for issues, _ in parsed:
         all_issues.extend(issues)
     # pyproject
     pyproj = root / "pyproject.toml"
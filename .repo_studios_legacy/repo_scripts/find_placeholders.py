@@ -3,38 +3,169 @@
 Scan the codebase for placeholder comments (TODO, FIXME, NOTE, etc.) and output them as a list.
 
 Usage:
-    python find_placeholders.py [root_dir]
-If no root_dir is given, scans current directory.
+    python find_placeholders.py [root_dir] [--jobs N] [--no-cache]
+If no root_dir is given, scans current directory. Files are read on N threads
+(default: CPU count); output order is the same for any N.
+
+Per-file results are cached in <root_dir>/.repo_studios/placeholders.cache. A file
+whose (mtime, size) is unchanged is not read again; otherwise its BLAKE2b digest
+decides whether the cached hits still apply. Entries are re-verified by digest after
+24h, and entries for files no longer present are dropped. The cache records the
+scanner's pattern and format; if either changed, the whole cache is discarded.
 """
 
+import argparse
+import hashlib
+import json
+import logging
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 PLACEHOLDER_PATTERNS = [r"TODO", r"FIXME", r"NOTE", r"XXX", r"OPTIMIZE", r"REVIEW"]
 COMMENT_REGEX = re.compile(r"#.*?(" + "|".join(PLACEHOLDER_PATTERNS) + r")[:\s]", re.IGNORECASE)
+# Same pattern over a whole file's bytes; `.` stops at "\n", so a match stays on one line.
+COMMENT_REGEX_B = re.compile(COMMENT_REGEX.pattern.encode("ascii"), re.IGNORECASE)
+SCANNED_SUFFIXES = (".py", ".md", ".txt", ".js", ".ts", ".yaml", ".yml", ".json")
+# Resolved against root_dir; the suffix keeps the cache itself out of the scan.
+CACHE_PATH = Path(".repo_studios/placeholders.cache")
+CACHE_TTL_SECONDS = 24 * 60 * 60
+# Bump when the entry layout or hit extraction changes; cached hits are only valid
+# for the scanner that produced them.
+CACHE_FORMAT = 1
+CACHE_KEY = f"{CACHE_FORMAT}:{COMMENT_REGEX_B.flags}:{COMMENT_REGEX_B.pattern.decode('ascii')}"
 
 
-def scan_placeholders(root_dir: str) -> list[tuple[str, int, str]]:
+def _scan_data(name: str, data: bytes) -> list[tuple[str, int, str]]:
+    if b"#" not in data:
+        return []  # every placeholder comment starts with "#"
+    if b"\r" in data:
+        # Line numbers follow universal newlines, as text-mode reading did.
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
     results = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        for fname in filenames:
-            if fname.endswith((".py", ".md", ".txt", ".js", ".ts", ".yaml", ".yml", ".json")):
-                fpath = Path(dirpath) / fname
-                try:
-                    with fpath.open("r", encoding="utf-8", errors="ignore") as f:
-                        for lineno, line in enumerate(f, 1):
-                            if COMMENT_REGEX.search(line):
-                                results.append((str(fpath), lineno, line.strip()))
-                except Exception:
-                    continue
+    lineno, counted, pos = 1, 0, 0
+    # One hit per line: after a match, searching resumes at the next line.
+    while m := COMMENT_REGEX_B.search(data, pos):
+        start = m.start()
+        lineno += data.count(b"\n", counted, start)
+        counted = start
+        line_start = data.rfind(b"\n", 0, start) + 1
+        line_end = data.find(b"\n", start)
+        if line_end == -1:
+            line_end = len(data)
+        results.append((name, lineno, data[line_start:line_end].decode("utf-8", "ignore").strip()))
+        pos = line_end + 1
     return results
 
 
+def _scan_one(fpath: Path) -> list[tuple[str, int, str]]:
+    try:
+        data = fpath.read_bytes()
+    except Exception:
+        return []
+    return _scan_data(str(fpath), data)
+
+
+def _scan_cached(
+    fpath: Path, entry: Any, now: float
+) -> tuple[list[tuple[str, int, str]], list[Any] | None]:
+    """Scan `fpath` unless `entry` still describes it; return its hits and new entry.
+
+    Entries are `[mtime_ns, size, blake2b_hex, verified_at, [[lineno, line], ...]]`.
+    """
+    name = str(fpath)
+    try:
+        st = fpath.stat()
+    except OSError:
+        return [], None
+    stamp = [st.st_mtime_ns, st.st_size]
+    valid = isinstance(entry, list) and len(entry) == 5
+    if valid and entry[:2] == stamp and now - entry[3] < CACHE_TTL_SECONDS:
+        return [(name, lineno, line) for lineno, line in entry[4]], entry
+    try:
+        data = fpath.read_bytes()
+    except Exception:
+        return [], None
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if valid and entry[2] == digest:
+        hits = [(name, lineno, line) for lineno, line in entry[4]]
+    else:
+        hits = _scan_data(name, data)
+    return hits, [*stamp, digest, now, [[lineno, line] for _, lineno, line in hits]]
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    """Return the cached entries, or {} if the file is unreadable or from another scanner."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("key") != CACHE_KEY:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(path: Path, cache: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".tmp-{path.name}")
+        tmp.write_text(json.dumps({"key": CACHE_KEY, "files": cache}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:  # cache is best effort
+        logging.debug("Could not write placeholder cache %s: %s", path, exc)
+
+
+def scan_placeholders(
+    root_dir: str, jobs: int | None = None, cache_path: Path | None = None
+) -> list[tuple[str, int, str]]:
+    paths = [
+        Path(dirpath) / fname
+        for dirpath, _, filenames in os.walk(root_dir)
+        for fname in filenames
+        if fname.endswith(SCANNED_SUFFIXES)
+    ]
+    if cache_path is None:
+        worker = _scan_one
+    else:
+        cache = _load_cache(cache_path)
+        fresh: dict[str, Any] = {}
+        now = time.time()
+
+        def worker(fpath: Path) -> list[tuple[str, int, str]]:
+            hits, entry = _scan_cached(fpath, cache.get(str(fpath)), now)
+            if entry is not None:
+                fresh[str(fpath)] = entry  # one key per file, so threads never collide
+            return hits
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs < 2 or len(paths) < 2:
+        found = [hit for hits in map(worker, paths) for hit in hits]
+    else:
+        # Reads release the GIL, so file I/O overlaps across threads; map() keeps walk order.
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            found = [hit for hits in pool.map(worker, paths) for hit in hits]
+    if cache_path is not None and fresh != cache:
+        _save_cache(cache_path, fresh)
+    return found
+
+
 def main():
-    root_dir = sys.argv[1] if len(sys.argv) > 1 else str(Path.cwd())
-    found = scan_placeholders(root_dir)
+    ap = argparse.ArgumentParser(description="List placeholder comments (TODO, FIXME, ...)")
+    ap.add_argument("root_dir", nargs="?", default=str(Path.cwd()))
+    ap.add_argument("-j", "--jobs", type=int, help="reader threads (default: CPU count)")
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or update <root_dir>/{CACHE_PATH}",
+    )
+    args = ap.parse_args()
+    cache_path = None if args.no_cache else Path(args.root_dir) / CACHE_PATH
+    found = scan_placeholders(args.root_dir, args.jobs, cache_path)
     # Emit results to stdout but avoid extra chatter so linters don't flag prints here.
     for fpath, lineno, line in found:
         sys.stdout.write(f"{fpath}:{lineno}: {line}\n")
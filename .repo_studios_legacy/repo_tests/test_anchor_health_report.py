@@ -0,0 +1,25 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "repo_scripts"
+
+
+def load_anchor_health_module(monkeypatch):
+    # The report imports its sibling `anchor_inventory`, as it does when run as a script.
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    path = SCRIPTS_DIR / "anchor_health_report.py"
+    spec = importlib.util.spec_from_file_location("anchor_health_report", str(path))
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod  # type: ignore[index]
+    spec.loader.exec_module(mod)  # type: ignore[assignment]
+    return mod
+
+
+def test_scan_splits_headings_on_cr_only_line_endings(tmp_path: Path, monkeypatch):
+    mod = load_anchor_health_module(monkeypatch)
+    md = tmp_path / "classic_mac.md"
+    md.write_bytes(b"# Title\rIntro text\r## Second Part\r### Deep\r## Title\r")
+
+    assert mod._scan(str(md)) == ["title", "second-part", "title"]
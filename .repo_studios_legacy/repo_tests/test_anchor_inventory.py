@@ -0,0 +1,27 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def load_anchor_inventory_module():
+    path = Path(__file__).resolve().parents[1] / "repo_scripts" / "anchor_inventory.py"
+    spec = importlib.util.spec_from_file_location("anchor_inventory", str(path))
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod  # type: ignore[index]
+    spec.loader.exec_module(mod)  # type: ignore[assignment]
+    return mod
+
+
+def test_collect_splits_headings_on_cr_only_line_endings(tmp_path: Path):
+    mod = load_anchor_inventory_module()
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    md = docs / "classic_mac.md"
+    md.write_bytes(b"# Title\rIntro text\r## Second Part\r### Deep\r## Title\r")
+
+    stats = mod.collect(docs)
+
+    assert sorted(stats) == ["second-part", "title"]
+    assert stats["title"].count == 2
+    assert stats["title"].files == [str(md)]